@@ -1,6 +1,8 @@
 # Import required modules
 import pygame
+from collections import OrderedDict
 from utils.constants import *
+from utils.fonts import get_font
 
 class BaseState:
     """
@@ -8,6 +10,16 @@ class BaseState:
     Provides common functionality and interface for state management.
     """
     
+    # Full-window translucent overlays shared by all states, keyed by (color, alpha)
+    overlays = {}
+    # Rendered text shared by all states, keyed by (font, text, color, scale)
+    texts = OrderedDict()
+    # Whether render() only uses blit, blits and fill, so it can draw on a TextureCanvas
+    supports_canvas = False
+    # Whether the state has snapshot() and render_snapshot(), so it can be
+    # drawn while the next ticks are simulated on another thread
+    supports_snapshot = False
+    
     def __init__(self, game):
         """
         Initialize the base state
@@ -16,13 +28,15 @@ class BaseState:
             game: Reference to the main game object
         """
         self.game = game
-        # Initialize fonts for text rendering
-        self.font = pygame.font.SysFont('arial', FONT_SIZE)
-        self.title_font = pygame.font.SysFont('arial', TITLE_FONT_SIZE)
+        # Fonts for text rendering, shared with every other state
+        self.font = get_font(FONT_NAME, FONT_SIZE)
+        self.title_font = get_font(FONT_NAME, TITLE_FONT_SIZE)
+        # Set when the whole screen must be repainted on the next render
+        self.full_redraw = True
         
     def enter(self):
         """Called when entering the state. Override in child classes if needed."""
-        pass
+        self.full_redraw = True
         
     def exit(self):
         """Called when exiting the state. Override in child classes if needed."""
@@ -37,19 +51,116 @@ class BaseState:
         """
         pass
         
-    def update(self):
-        """Update game logic. Override in child classes."""
+    def update(self, dt):
+        """
+        Advance game logic by one fixed simulation tick. Override in child classes.
+        
+        Args:
+            dt (float): Length of the tick in seconds
+        """
         pass
         
-    def render(self, screen):
+    def render(self, screen, interpolation=1.0):
         """
         Render the state
         
         Args:
             screen: Pygame surface to render to
+            interpolation (float): How far (0-1) the frame lies between the
+                previous and the latest simulation tick
+                
+        Returns:
+            list: Rects of the screen that changed, or None if the whole
+                screen should be updated
+        """
+        return None
+        
+    def get_overlay(self, alpha, color=BLACK):
+        """
+        Get a cached full-window overlay surface
+        
+        Args:
+            alpha (int): Overlay opacity (0-255)
+            color (tuple): RGB overlay color
+            
+        Returns:
+            pygame.Surface: Overlay surface, shared between states
+        """
+        key = (color, alpha)
+        overlay = BaseState.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            overlay.fill(color)
+            overlay.set_alpha(alpha)
+            BaseState.overlays[key] = overlay
+        return overlay
+        
+    def get_text(self, font, text, color=WHITE, scale=1.0):
+        """
+        Get a cached antialiased text surface, rendering it on a miss
+        
+        Colored text is tinted from the cached white rendering and scaled
+        text is resized from the cached unscaled one, so animated colors
+        and sizes never rasterize the string again. Callers animating a
+        color should round it to TEXT_COLOR_STEP to bound the cache.
+        
+        Args:
+            font: Pygame font to render with
+            text (str): Text to render
+            color (tuple): RGB text color
+            scale (float): Size multiplier, rounded to TEXT_SCALE_STEP
+            
+        Returns:
+            pygame.Surface: Text surface with per-pixel alpha
+        """
+        scale = round(round(scale / TEXT_SCALE_STEP) * TEXT_SCALE_STEP, 6)
+        color = tuple(color)
+        key = (font, text, color, scale)
+        texts = BaseState.texts
+        surface = texts.get(key)
+        if surface is not None:
+            texts.move_to_end(key)
+            return surface
+            
+        if scale != 1.0:
+            base = self.get_text(font, text, color)
+            width, height = base.get_size()
+            surface = pygame.transform.scale(
+                base, (max(1, int(width * scale)), max(1, int(height * scale)))
+            )
+        elif color != WHITE:
+            # Multiplying white glyphs by the color keeps the antialiased alpha
+            surface = self.get_text(font, text).copy()
+            surface.fill(tuple(color) + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+        else:
+            surface = font.render(text, True, WHITE)
+            # Match the display format when there is one, for faster blits
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+                
+        texts[key] = surface
+        if len(texts) > TEXT_CACHE_SIZE:
+            texts.popitem(last=False)
+        return surface
+        
+    def apply_quality(self, settings):
+        """
+        Adjust optional effects to a quality preset. Override in child classes.
+        
+        Args:
+            settings (dict): Preset from QUALITY_PRESETS
         """
         pass
         
+    def get_counts(self):
+        """
+        Get object counts for the frame profiler. Override in child classes.
+        
+        Returns:
+            dict: Counts keyed by name (e.g. 'jellies', 'particles')
+        """
+        return {}
+        
     def create_button(self, text, center_pos):
         """
         Create a button with text
@@ -61,7 +172,7 @@ class BaseState:
         Returns:
             tuple: (text_surface, button_rect) for rendering
         """
-        text_surface = self.font.render(text, True, WHITE)
+        text_surface = self.get_text(self.font, text)
         button_rect = pygame.Rect(0, 0, BUTTON_WIDTH, BUTTON_HEIGHT)
         button_rect.center = center_pos
         return text_surface, button_rect
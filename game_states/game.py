@@ -1,127 +1,104 @@
 import pygame
 import random
-import math
 import numpy as np
+from collections import deque
 from utils.constants import *
 from game_states.base_state import BaseState
+from utils.entity_store import EntityStore
+from utils.particles import ParticleSystem
+from utils.sprite_cache import SpriteCache
+from utils.background import AnimatedBackground, grid_pattern
+from utils.trail_layer import TrailLayer
+from utils.shake_layer import ShakeLayer
+from utils.decal_layer import DecalLayer
+from utils.spatial_hash import SpatialHash
+from utils.collision import polyline_circle_hits
+from utils.pool import Pool
+from utils.replay import Replay
+from utils.swipe import SwipePath
+from utils.state_snapshot import (SnapshotWriter, SnapshotReader, RewindBuffer,
+                                  save_random, restore_random)
 
-class Jelly:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.radius = 30
-        self.vel_x = random.uniform(-6, 6)  # Reduced horizontal speed
-        self.vel_y = INITIAL_VELOCITY * random.uniform(0.8, 1.2)  # Randomize initial velocity
-        self.squish = 1.0
-        self.squish_vel = 0
-        self.alive = True
-        
-    def update(self):
-        # Update position
-        self.x += self.vel_x
-        self.y += self.vel_y
-        self.vel_y += GRAVITY
-        
-        # Bounce off walls
-        if self.x < self.radius:
-            self.x = self.radius
-            self.vel_x *= -0.8
-        elif self.x > WINDOW_WIDTH - self.radius:
-            self.x = WINDOW_WIDTH - self.radius
-            self.vel_x *= -0.8
-            
-        # Update squish animation
-        self.squish += self.squish_vel
-        self.squish_vel += (1 - self.squish) * 0.2  # Spring force
-        self.squish_vel *= 0.8  # Damping
-        
-    def draw(self, screen):
-        # Draw squished circle
-        squished_radius_x = self.radius * (2 - self.squish)
-        squished_radius_y = self.radius * self.squish
-        pygame.draw.ellipse(screen, self.color,
-            (self.x - squished_radius_x, self.y - squished_radius_y,
-             squished_radius_x * 2, squished_radius_y * 2))
-        
-        # Add highlight
-        highlight_pos = (
-            self.x - squished_radius_x * 0.3,
-            self.y - squished_radius_y * 0.3
-        )
-        pygame.draw.circle(screen, (255, 255, 255), highlight_pos, 5)
-
-class Bomb:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.radius = 20
-        self.vel_x = random.uniform(-4, 4)  # Reduced horizontal speed
-        self.vel_y = INITIAL_VELOCITY * random.uniform(0.9, 1.1)  # Randomize initial velocity
-        self.flash_time = 0
-        
-    def update(self):
-        self.x += self.vel_x
-        self.y += self.vel_y
-        self.vel_y += GRAVITY
-        self.flash_time += 1
-        
-        # Bounce off walls
-        if self.x < self.radius:
-            self.x = self.radius
-            self.vel_x *= -0.8
-        elif self.x > WINDOW_WIDTH - self.radius:
-            self.x = WINDOW_WIDTH - self.radius
-            self.vel_x *= -0.8
-        
-    def draw(self, screen):
-        # Draw bomb body
-        pygame.draw.circle(screen, (30, 30, 30), (self.x, self.y), self.radius)
-        
-        # Draw fuse
-        fuse_start = (self.x, self.y - self.radius)
-        fuse_end = (self.x + math.sin(self.flash_time * 0.2) * 10,
-                   self.y - self.radius - 15)
-        pygame.draw.line(screen, (100, 100, 100), fuse_start, fuse_end, 3)
-        
-        # Draw flashing effect
-        if self.flash_time % 10 < 5:
-            pygame.draw.circle(screen, (255, 200, 0),
-                             (fuse_end[0], fuse_end[1]), 5)
+class FadingTrail:
+    # Slice trail that keeps fading after the mouse is released (pooled)
+    __slots__ = ('points', 'alpha')
+    
+    def reset(self, points):
+        # Reuse the point list of a recycled trail instead of copying
+        if not hasattr(self, 'points'):
+            self.points = []
+        self.points[:] = points
+        self.alpha = 255
 
-class Particle:
-    def __init__(self, x, y, color, velocity, lifetime):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vel_x = velocity[0]
-        self.vel_y = velocity[1]
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        
-    def update(self):
-        self.x += self.vel_x
-        self.y += self.vel_y
-        self.vel_y += GRAVITY * 0.5
-        self.lifetime -= 1
-        
-    def draw(self, screen):
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = (*self.color[:3], alpha)
-        surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (2, 2), 2)
-        screen.blit(surf, (int(self.x - 2), int(self.y - 2)))
+class GameSnapshot:
+    # Copy of everything render() draws, so a frame can be drawn while the
+    # simulation moves on (see JellyNinja's pipelined mode)
+    __slots__ = ('time', 'score', 'combo', 'screen_shake', 'jellies', 'bombs',
+                 'particles', 'trails', 'active_trail', 'decal_ops')
 
 class Game(BaseState):
+    # Balance settings that can be changed per instance (e.g. by sweep.py)
+    TUNING = ('spawn_interval', 'difficulty_interval', 'difficulty_step', 'bomb_chance')
+    # Rendering is all cached-sprite blits, so it can run on the texture backend
+    supports_canvas = True
+    # Can be drawn from a snapshot while the next ticks are simulated
+    supports_snapshot = True
+    
     def __init__(self, game):
         super().__init__(game)
+        self.spawn_interval = SPAWN_INTERVAL
+        self.difficulty_interval = DIFFICULTY_INCREASE_INTERVAL
+        self.difficulty_step = DIFFICULTY_STEP
+        self.bomb_chance = BOMB_CHANCE
+        self.sprites = SpriteCache()
+        self.trail_layer = TrailLayer()
+        self.shake_layer = ShakeLayer()
+        self.decals = DecalLayer()  # Background splatters
+        # Effects are recycled through pools, so long sessions stop allocating them
+        self.trail_pool = Pool(FadingTrail)
+        self.slice_fade = []
+        self.rewind = RewindBuffer()  # Recent binary snapshots, for rewinding and crash dumps
+        # Only a player at the keyboard can rewind, so headless runs (simulations,
+        # replays, sweeps) skip the periodic snapshots
+        self.keep_history = not self.game.headless
+        self.quality = None
+        self.apply_quality(self.game.quality.settings)
         self.reset_game()
         
-    def reset_game(self):
-        self.jellies = []
-        self.bombs = []
-        self.particles = []
-        self.background_splatters = []  # For splatter effects
+    def apply_quality(self, settings):
+        # Only cosmetic effects change, so gameplay and replays are unaffected
+        if self.quality is None or settings['background_spacing'] != self.quality['background_spacing']:
+            self.background = AnimatedBackground(
+                grid_pattern((30, 30, 60), 20, 80, 20, settings['background_spacing']), fill=(20, 20, 40)
+            )
+        self.particle_count = settings['particle_count']
+        self.trail_length = settings['trail_length']
+        if self.quality is not None:
+            self.mouse_positions = deque(self.mouse_positions, maxlen=self.trail_length)
+        self.splatters = settings['splatter_fade'] is not None
+        self.decals.fade_step = settings['splatter_fade'] or 0
+        if not self.splatters:
+            self.decals.clear()
+        self.quality = settings
+        
+    def reset_game(self, seed=None):
+        # Each game gets its own seeded RNGs so a seed and the same input replay exactly
+        if seed is None:
+            seed = self.game.seed if self.game.seed is not None else random.getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.fx_rng = random.Random()  # Cosmetic randomness that must not affect gameplay
+        
+        self.jellies = EntityStore()
+        self.bombs = EntityStore()
+        self.jelly_grid = SpatialHash()
+        self.bomb_grid = SpatialHash()
+        self.jelly_grid.build(self.jellies)
+        self.bomb_grid.build(self.bombs)
+        self.particles = ParticleSystem(rng=np.random.default_rng(seed), sprites=self.sprites)
+        # Clear the last game's effects, returning trails to their pool
+        self.decals.clear()
+        self.trail_pool.release_dead(self.slice_fade, lambda trail: False)
         self.score = 0
         self.combo = 0
         self.combo_timer = 0
@@ -129,310 +106,376 @@ class Game(BaseState):
         self.difficulty_timer = 0
         self.difficulty_level = 1
         self.screen_shake = 0
-        self.mouse_positions = []
+        self.mouse_positions = deque(maxlen=self.trail_length)  # Oldest points drop off the front
+        self.swipe = SwipePath()  # Swipe points not yet checked for slices
         self.is_slicing = False
-        self.slice_fade = []  # List of tuples (points, alpha)
         self.time = 0
+        self.ticks = 0  # Simulation ticks run this game
+        self.replay = Replay(seed)  # Input recorded for replaying this game
+        self.rewind.clear()
+        
+    def save_state(self):
+        # Pack the simulation state into a compact binary snapshot. Cosmetic
+        # state (background, splatters, screen shake randomness) is left out.
+        writer = SnapshotWriter()
+        writer.pack('qIiidddddd?', self.seed, self.ticks, self.score, self.combo,
+                    self.combo_timer, self.spawn_timer, self.difficulty_timer,
+                    self.difficulty_level, self.screen_shake, self.time, self.is_slicing)
+        save_random(writer, self.rng)
+        self.jellies.save(writer)
+        self.bombs.save(writer)
+        self.particles.save(writer)
+        writer.array(np.array(self.mouse_positions, dtype=np.int32).reshape(-1, 2))
+        swipe = self.swipe
+        writer.array(np.array(swipe.points, dtype=np.float64).reshape(-1, 2))
+        writer.array(np.array([] if swipe.previous is None else [swipe.previous], dtype=np.float64).reshape(-1, 2))
+        # Fading trails: their alphas, point counts and all their points
+        writer.array(np.array([trail.alpha for trail in self.slice_fade], dtype=np.int32))
+        writer.array(np.array([len(trail.points) for trail in self.slice_fade], dtype=np.int32))
+        writer.array(np.array([p for trail in self.slice_fade for p in trail.points], dtype=np.int32).reshape(-1, 2))
+        return writer.getvalue()
+        
+    def restore_state(self, data):
+        # Replace the simulation state with one from save_state()
+        reader = SnapshotReader(data)
+        (seed, self.ticks, self.score, self.combo, self.combo_timer, self.spawn_timer,
+         self.difficulty_timer, self.difficulty_level, self.screen_shake, self.time,
+         self.is_slicing) = reader.unpack('qIiidddddd?')
+        restore_random(reader, self.rng)
+        self.jellies.restore(reader)
+        self.bombs.restore(reader)
+        self.particles.restore(reader)
+        self.jelly_grid.build(self.jellies)
+        self.bomb_grid.build(self.bombs)
+        self.mouse_positions = deque(map(tuple, reader.array(np.int32, 2).tolist()), maxlen=self.trail_length)
+        self.swipe.points = list(map(tuple, reader.array(np.float64, 2).tolist()))
+        previous = reader.array(np.float64, 2).tolist()
+        self.swipe.previous = tuple(previous[0]) if previous else None
+        alphas = reader.array(np.int32).tolist()
+        lengths = reader.array(np.int32).tolist()
+        points = list(map(tuple, reader.array(np.int32, 2).tolist()))
+        self.trail_pool.release_dead(self.slice_fade, lambda trail: False)
+        start = 0
+        for alpha, length in zip(alphas, lengths):
+            trail = self.trail_pool.acquire(points[start:start + length])
+            trail.alpha = alpha
+            self.slice_fade.append(trail)
+            start += length
+        self.decals.clear()
+        # Input after the snapshot never happened now; a snapshot from another
+        # game starts a new recording, which only covers input from here on
+        if seed == self.seed:
+            self.replay.truncate(self.ticks)
+        else:
+            self.seed = seed
+            self.replay = Replay(seed)
+            self.rewind.clear()
+        
+    def rewind_game(self, ticks=REWIND_TICKS):
+        # Go back to the newest snapshot at least `ticks` ticks old
+        snapshot = self.rewind.rewind(self.ticks - ticks)
+        if snapshot is not None:
+            self.restore_state(snapshot[1])
+        
+    def exit(self):
+        # Keep a replay of every game that ends or is abandoned
+        self.replay.ticks = self.ticks
+        self.game.save_replay(self.replay)
         
     def spawn_objects(self):
         # Spawn new jellies and bombs based on difficulty
-        if random.random() < 0.7:  # 70% chance to spawn something
-            x = random.randint(50, WINDOW_WIDTH - 50)
-            if random.random() < 0.3 * self.difficulty_level:  # Increased bomb frequency
-                self.bombs.append(Bomb(x, WINDOW_HEIGHT + 50))
+        if self.rng.random() < 0.7:  # 70% chance to spawn something
+            x = self.rng.randint(50, WINDOW_WIDTH - 50)
+            if self.rng.random() < self.bomb_chance * self.difficulty_level:  # Increased bomb frequency
+                self.spawn_bomb(x, WINDOW_HEIGHT + 50)
             else:
-                self.jellies.append(Jelly(x, WINDOW_HEIGHT + 50, random.choice(JELLY_COLORS)))
+                self.spawn_jelly(x, WINDOW_HEIGHT + 50, self.rng.randrange(len(JELLY_COLORS)))
+                
+    def spawn_jelly(self, x, y, color):
+        return self.jellies.spawn(
+            x, y,
+            self.rng.uniform(-6, 6),  # Reduced horizontal speed
+            INITIAL_VELOCITY * self.rng.uniform(0.8, 1.2),  # Randomize initial velocity
+            30, color
+        )
+        
+    def spawn_bomb(self, x, y):
+        return self.bombs.spawn(
+            x, y,
+            self.rng.uniform(-4, 4),  # Reduced horizontal speed
+            INITIAL_VELOCITY * self.rng.uniform(0.9, 1.1),  # Randomize initial velocity
+            20
+        )
         
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        # Motion only matters mid-swipe, so the rest is not worth recording
+        if event.type != pygame.MOUSEMOTION or self.is_slicing:
+            self.replay.record(self.ticks, event)
+            
+        if event.type == pygame.KEYDOWN and event.key == REWIND_KEY:
+            self.rewind_game()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             self.is_slicing = True
-            self.mouse_positions = [event.pos]  # Start new slice
+            self.mouse_positions.clear()  # Start new slice
+            self.mouse_positions.append(event.pos)
+            self.swipe.start(event.pos)
         elif event.type == pygame.MOUSEBUTTONUP:
+            # Check the end of the swipe before it is forgotten
+            if self.is_slicing and self.swipe.pending():
+                self.check_slices()
             if self.is_slicing and len(self.mouse_positions) >= 2:
                 # Add current trail to fading trails
-                self.slice_fade.append((self.mouse_positions.copy(), 255))
+                self.slice_fade.append(self.trail_pool.acquire(self.mouse_positions))
             self.is_slicing = False
-            self.mouse_positions = []
+            self.mouse_positions.clear()
+            self.swipe.clear()
         elif event.type == pygame.MOUSEMOTION and self.is_slicing:
+            # Only collect the point; slices are checked once per tick in update()
             self.mouse_positions.append(event.pos)
-            if len(self.mouse_positions) > SLICE_TRAIL_LENGTH:
-                self.mouse_positions.pop(0)
-                
-            # Check for slicing only while mouse button is held
-            if len(self.mouse_positions) >= 2:
-                self.check_slices()
+            self.swipe.add(event.pos)
                 
     def check_slices(self):
-        # Get the last two mouse positions for line segment
-        p1 = self.mouse_positions[-2]
-        p2 = self.mouse_positions[-1]
+        # Test every swipe segment added since the last check in one batch.
+        # Returns True if a bomb was hit and the game is over.
+        points = self.swipe.take()
         
-        sliced_something = False
+        jelly_hits, jelly_segments = self.find_hits(self.jellies, self.jelly_grid, points)
+        bomb_hits, bomb_segments = self.find_hits(self.bombs, self.bomb_grid, points)
         
-        # Check jellies
-        for jelly in self.jellies[:]:
-            if self.line_circle_intersection(
-                p1, p2, (jelly.x, jelly.y), jelly.radius
-            ):
-                self.slice_jelly(jelly)
+        # Resolve hits segment by segment in swipe order: jellies first, then bombs
+        j = 0
+        for segment in range(len(points) - 1):
+            sliced_something = False
+            
+            # Check jellies (children spawned by a slice are not tested until the next check)
+            while j < len(jelly_hits) and jelly_segments[j] == segment:
+                self.slice_jelly(jelly_hits[j])
                 sliced_something = True
+                j += 1
                 
-        # Check bombs
-        for bomb in self.bombs[:]:
-            if self.line_circle_intersection(
-                p1, p2, (bomb.x, bomb.y), bomb.radius
-            ):
-                self.trigger_bomb(bomb)
-                return  # Game over, no need to check more
+            # Check bombs
+            if bomb_segments and bomb_segments[0] == segment:
+                self.trigger_bomb(bomb_hits[0])
+                return True  # Game over, no need to check more
                 
-        # Update combo
-        if sliced_something:
-            self.combo += 1
-            self.combo_timer = COMBO_TIME
-            if self.combo >= 3:
-                self.score += self.combo * 2  # Bonus points for combo
-        
-    def line_circle_intersection(self, p1, p2, center, radius):
-        # Vector from p1 to center
-        cx = center[0] - p1[0]
-        cy = center[1] - p1[1]
-        
-        # Vector from p1 to p2
-        vx = p2[0] - p1[0]
-        vy = p2[1] - p1[1]
-        
-        # Length of line segment squared
-        l2 = vx*vx + vy*vy
-        
-        # If points are the same, check if center is within radius of point
-        if l2 == 0:
-            return (cx*cx + cy*cy) <= radius*radius * 1.5  # Increased hit box slightly
-            
-        # Dot product of v and center-p1
-        t = max(0, min(1, (cx*vx + cy*vy) / l2))
-        
-        # Point on line closest to circle center
-        projection_x = p1[0] + t * vx
-        projection_y = p1[1] + t * vy
+            # Update combo
+            if sliced_something:
+                self.combo += 1
+                self.combo_timer = COMBO_TIME
+                if self.combo >= 3:
+                    self.score += self.combo * 2  # Bonus points for combo
+        return False
+                    
+    def find_hits(self, store, grid, points):
+        # Narrow the store down with the grid, then run the exact batched test
+        candidates = grid.query_polyline(points, SLICE_HIT_SCALE)
+        hits, segments = polyline_circle_hits(
+            points, store.x[candidates], store.y[candidates],
+            store.radius[candidates], SLICE_HIT_SCALE
+        )
+        return candidates[hits].tolist(), segments.tolist()
         
-        # Check if closest point is within radius (increased hit box)
-        dx = center[0] - projection_x
-        dy = center[1] - projection_y
-        return (dx*dx + dy*dy) <= radius*radius * 1.5  # Increased hit box
+    def slice_jelly(self, i):
+        jellies = self.jellies
+        x = float(jellies.x[i])
+        y = float(jellies.y[i])
+        color = JELLY_COLORS[jellies.color[i]]
         
-    def slice_jelly(self, jelly):
         # Add background splatter effect
-        splatter = {
-            'pos': (jelly.x, jelly.y),
-            'color': jelly.color,
-            'size': random.randint(40, 80),
-            'alpha': 255
-        }
-        self.background_splatters.append(splatter)
+        size = self.rng.randint(40, 80)  # Drawn even without splatters to keep the RNG in step
+        if self.splatters:
+            self.decals.stamp(self.sprites.splatter(color, size, 255), (x, y))
         
         # Remove the jelly
-        if jelly in self.jellies:
-            self.jellies.remove(jelly)
+        if jellies.kill(i):
             self.score += 1
             
             # Create particle effects
-            for _ in range(PARTICLE_COUNT):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(2, 8)
-                velocity = (
-                    math.cos(angle) * speed,
-                    math.sin(angle) * speed
-                )
-                self.particles.append(
-                    Particle(
-                        jelly.x, jelly.y,
-                        jelly.color,
-                        velocity,
-                        random.randint(20, 40)
-                    )
-                )
+            self.particles.emit(x, y, color, self.particle_count, (2, 8), (20, 40))
                 
             # Create two smaller jellies
-            if jelly.radius > 15:  # Only split if big enough
+            radius = float(jellies.radius[i])
+            if radius > 15:  # Only split if big enough
+                vel_x = float(jellies.vel_x[i])
+                vel_y = float(jellies.vel_y[i])
                 for _ in range(2):
-                    new_jelly = Jelly(
-                        jelly.x + random.uniform(-10, 10),
-                        jelly.y + random.uniform(-10, 10),
-                        jelly.color
+                    jellies.spawn(
+                        x + self.rng.uniform(-10, 10),
+                        y + self.rng.uniform(-10, 10),
+                        vel_x + self.rng.uniform(-5, 5),
+                        vel_y + self.rng.uniform(-5, 5),
+                        radius * 0.7,
+                        jellies.color[i],
+                        squish=0.5  # Start squished
                     )
-                    new_jelly.radius = jelly.radius * 0.7
-                    new_jelly.vel_x = jelly.vel_x + random.uniform(-5, 5)
-                    new_jelly.vel_y = jelly.vel_y + random.uniform(-5, 5)
-                    new_jelly.squish = 0.5  # Start squished
-                    self.jellies.append(new_jelly)
                     
-    def trigger_bomb(self, bomb):
+    def trigger_bomb(self, i):
         # Remove the bomb
-        if bomb in self.bombs:
-            self.bombs.remove(bomb)
+        if self.bombs.kill(i):
+            x = float(self.bombs.x[i])
+            y = float(self.bombs.y[i])
             
             # Create explosion particles
-            for _ in range(PARTICLE_COUNT * 2):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(5, 15)
-                velocity = (
-                    math.cos(angle) * speed,
-                    math.sin(angle) * speed
-                )
-                self.particles.append(
-                    Particle(
-                        bomb.x, bomb.y,
-                        (255, 100, 0),
-                        velocity,
-                        random.randint(30, 60)
-                    )
-                )
+            self.particles.emit(x, y, (255, 100, 0), self.particle_count * 2, (5, 15), (30, 60))
             
             # Trigger screen shake
             self.screen_shake = SHAKE_DURATION
             
             # Update high score and change to game over state
+            self.replay.game_over = True
             self.game.high_score.update_high_score(self.score)
             self.game.change_state('game_over')
             
-    def update(self):
-        self.time += 1/60
+    def get_counts(self):
+        return {
+            'jellies': len(self.jellies),
+            'bombs': len(self.bombs),
+            'particles': len(self.particles)
+        }
+        
+    def update(self, dt):
+        # Check everything swiped since the last tick against the current positions
+        if self.swipe.pending() and self.check_slices():
+            return  # A bomb ended the game
+            
+        self.time += dt
+        self.ticks += 1
         
         # Update timers
-        self.spawn_timer += 1/60
-        self.difficulty_timer += 1/60
+        self.spawn_timer += dt
+        self.difficulty_timer += dt
         if self.combo > 0:
-            self.combo_timer -= 1/60
+            self.combo_timer -= dt
             if self.combo_timer <= 0:
                 self.combo = 0
                 
         # Update screen shake
         if self.screen_shake > 0:
-            self.screen_shake -= 1/60
+            self.screen_shake -= dt
             
         # Spawn new objects
-        if self.spawn_timer >= SPAWN_INTERVAL / self.difficulty_level:
+        if self.spawn_timer >= self.spawn_interval / self.difficulty_level:
             self.spawn_timer = 0
             self.spawn_objects()
                 
         # Increase difficulty
-        if self.difficulty_timer >= DIFFICULTY_INCREASE_INTERVAL:
+        if self.difficulty_timer >= self.difficulty_interval:
             self.difficulty_timer = 0
-            self.difficulty_level += 0.5
+            self.difficulty_level += self.difficulty_step
             
-        # Update objects
-        for jelly in self.jellies[:]:
-            jelly.update()
-            # Remove if out of bounds
-            if jelly.y > WINDOW_HEIGHT + 100 or jelly.y < -100:
-                self.jellies.remove(jelly)
-                
-        for bomb in self.bombs[:]:
-            bomb.update()
-            # Remove if out of bounds
-            if bomb.y > WINDOW_HEIGHT + 100 or bomb.y < -100:
-                self.bombs.remove(bomb)
+        # Update objects (out of bounds and sliced ones are culled here)
+        self.jellies.update()
+        self.bombs.update()
+        
+        # Re-index for slice hit testing until the next tick
+        self.jelly_grid.build(self.jellies)
+        self.bomb_grid.build(self.bombs)
                 
         # Update particles
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
                 
         # Update background splatters
-        for splatter in self.background_splatters[:]:
-            splatter['alpha'] -= 15  # Fade quickly
-            if splatter['alpha'] <= 0:
-                self.background_splatters.remove(splatter)
+        self.decals.fade()  # Fade quickly
                 
         # Update fading slice trails
-        for i in range(len(self.slice_fade) - 1, -1, -1):
-            points, alpha = self.slice_fade[i]
-            alpha -= 10  # Fade speed
-            if alpha <= 0:
-                self.slice_fade.pop(i)
-            else:
-                self.slice_fade[i] = (points, alpha)
+        for trail in self.slice_fade:
+            trail.alpha -= 10  # Fade speed
+        self.trail_pool.release_dead(self.slice_fade, lambda trail: trail.alpha > 0)
+        
+        # Keep recent history for rewinding and crash dumps
+        if self.keep_history and self.ticks % REWIND_INTERVAL == 0:
+            self.rewind.push(self.ticks, self.save_state())
                 
-    def render(self, screen):
-        # Draw animated background
-        screen.fill((20, 20, 40))
+    def snapshot(self):
+        # Copy what the next frame needs; only live entities are copied
+        snap = GameSnapshot()
+        snap.time = self.time
+        snap.score = self.score
+        snap.combo = self.combo
+        snap.screen_shake = self.screen_shake
+        snap.jellies = self.jellies.snapshot()
+        snap.bombs = self.bombs.snapshot()
+        snap.particles = self.particles.snapshot()
+        snap.trails = [(tuple(trail.points), trail.alpha) for trail in self.slice_fade]
+        snap.active_trail = None
+        if self.is_slicing and len(self.mouse_positions) >= 2:
+            snap.active_trail = tuple(self.mouse_positions)
+        snap.decal_ops = self.decals.take()
+        return snap
         
-        # Draw background effects
-        for x in range(0, WINDOW_WIDTH, 100):
-            for y in range(0, WINDOW_HEIGHT, 100):
-                color = (
-                    int(30 + 20 * math.sin(self.time + x / 200)),
-                    int(30 + 20 * math.sin(self.time + y / 150)),
-                    int(60 + 20 * math.cos(self.time * 0.7))
-                )
-                size = 80 + 20 * math.sin(self.time * 1.5 + x / 100)
-                pygame.draw.circle(screen, color, (x, y), size)
+    def render(self, screen, interpolation=1.0):
+        return self.render_snapshot(screen, self.snapshot(), interpolation)
         
-        # Draw background splatters
-        for splatter in self.background_splatters:
-            surf = pygame.Surface((splatter['size'], splatter['size']), pygame.SRCALPHA)
-            color = (*splatter['color'][:3], splatter['alpha'])
-            pygame.draw.circle(surf, color, (splatter['size']//2, splatter['size']//2), splatter['size']//2)
-            screen.blit(surf, (splatter['pos'][0] - splatter['size']//2, splatter['pos'][1] - splatter['size']//2))
+    def render_snapshot(self, screen, snap, interpolation=1.0):
+        # Only touches the snapshot and render-side caches, never simulation state
+        # Draw animated background
+        self.background.render(screen, snap.time)
+        
+        # Draw background splatters, all stamped into one fading layer
+        self.decals.apply(snap.decal_ops)
+        self.decals.draw(screen)
         
-        # Apply screen shake
-        shake_offset = (0, 0)
-        if self.screen_shake > 0:
-            shake_offset = (
-                random.randint(-SHAKE_INTENSITY, SHAKE_INTENSITY),
-                random.randint(-SHAKE_INTENSITY, SHAKE_INTENSITY)
-            )
-            
         # Draw fading slice trails
-        for points, alpha in self.slice_fade:
-            if len(points) >= 2:
-                trail_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-                for i in range(len(points) - 1):
-                    start = points[i]
-                    end = points[i + 1]
-                    progress = i / (len(points) - 1)
-                    color = (255, int(255 * (1 - progress)), int(255 * (1 - progress)), int(alpha * (1 - progress)))
-                    pygame.draw.line(trail_surf, color, start, end, 4)
-                screen.blit(trail_surf, (0, 0))
+        for points, alpha in snap.trails:
+            segments = len(points) - 1
+            colors = []
+            for i in range(segments):
+                progress = i / segments
+                colors.append((255, int(255 * (1 - progress)), int(255 * (1 - progress)), int(alpha * (1 - progress))))
+            self.trail_layer.draw(screen, points, colors)
         
         # Draw active slice trail
-        if self.is_slicing and len(self.mouse_positions) >= 2:
-            trail_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            for i in range(len(self.mouse_positions) - 1):
-                start = self.mouse_positions[i]
-                end = self.mouse_positions[i + 1]
-                progress = i / (len(self.mouse_positions) - 1)
-                color = (255, 255, 255, int(255 * (1 - progress)))
-                pygame.draw.line(trail_surf, color, start, end, 4)
-            screen.blit(trail_surf, (0, 0))
+        if snap.active_trail is not None:
+            segments = len(snap.active_trail) - 1
+            colors = [(255, 255, 255, int(255 * (1 - i / segments))) for i in range(segments)]
+            self.trail_layer.draw(screen, snap.active_trail, colors)
             
-        # Draw objects with screen shake
-        for jelly in self.jellies:
-            jelly.x += shake_offset[0]
-            jelly.y += shake_offset[1]
-            jelly.draw(screen)
-            jelly.x -= shake_offset[0]
-            jelly.y -= shake_offset[1]
+        # Draw objects, one cached sprite blit each. While the screen shakes they
+        # go onto the shake layer, which is then blitted once at the offset.
+        shaking = snap.screen_shake > 0
+        layer = self.shake_layer.begin() if shaking else screen
+        sprites = self.sprites
+        jellies = snap.jellies
+        live = jellies.live_indices()
+        xs, ys = jellies.positions(live, interpolation)
+        blits = []
+        for x, y, radius, squish, color in zip(
+            xs.tolist(),
+            ys.tolist(),
+            jellies.radius[live].tolist(),
+            jellies.squish[live].tolist(),
+            jellies.color[live].tolist()
+        ):
+            surf, anchor = sprites.jelly(JELLY_COLORS[color], radius, squish)
+            blits.append((surf, (x - anchor[0], y - anchor[1])))
             
-        for bomb in self.bombs:
-            bomb.x += shake_offset[0]
-            bomb.y += shake_offset[1]
-            bomb.draw(screen)
-            bomb.x -= shake_offset[0]
-            bomb.y -= shake_offset[1]
-            
-        for particle in self.particles:
-            particle.x += shake_offset[0]
-            particle.y += shake_offset[1]
-            particle.draw(screen)
-            particle.x -= shake_offset[0]
-            particle.y -= shake_offset[1]
+        bombs = snap.bombs
+        live = bombs.live_indices()
+        xs, ys = bombs.positions(live, interpolation)
+        for x, y, radius, flash_time in zip(
+            xs.tolist(),
+            ys.tolist(),
+            bombs.radius[live].tolist(),
+            bombs.flash_time[live].tolist()
+        ):
+            surf, anchor = sprites.bomb(radius, flash_time)
+            blits.append((surf, (x - anchor[0], y - anchor[1])))
+        if shaking:
+            rects = layer.blits(blits)
+            rects.append(snap.particles.draw(layer, interpolation=interpolation))
+            shake_offset = (
+                self.fx_rng.randint(-SHAKE_INTENSITY, SHAKE_INTENSITY),
+                self.fx_rng.randint(-SHAKE_INTENSITY, SHAKE_INTENSITY)
+            )
+            self.shake_layer.end(screen, shake_offset, rects)
+        else:
+            screen.blits(blits, doreturn=False)
+            snap.particles.draw(screen, interpolation=interpolation)
             
         # Draw score and combo
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        score_text = self.get_text(self.font, f"Score: {snap.score}")
         screen.blit(score_text, (20, 20))
         
-        if self.combo >= 3:
-            combo_text = self.font.render(f"Combo x{self.combo}!", True, (255, 200, 0))
+        if snap.combo >= 3:
+            combo_text = self.get_text(self.font, f"Combo x{snap.combo}!", (255, 200, 0))
             screen.blit(combo_text, (20, 60)) 
\ No newline at end of file
@@ -20,6 +20,14 @@ class GameOver(BaseState):
         super().__init__(game)
         self.time = 0  # For animations
         self.setup_buttons()
+        self.pulse_alpha = None
+        self.hover = None
+        self.drawn_time = None  # Animation time of the last drawn frame
+        
+        # Area the pulsing "New High Score!" message can cover
+        width, height = self.font.size("New High Score!")
+        self.record_area = pygame.Rect(0, 0, int(width * 1.1) + 4, int(height * 1.1) + 4)
+        self.record_area.center = (WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 90)
         
     def setup_buttons(self):
         """Create and position the game over screen buttons"""
@@ -37,6 +45,8 @@ class GameOver(BaseState):
                 'rect': button_rect,
                 'hover': False
             }
+        rects = [button['rect'] for button in self.buttons.values()]
+        self.buttons_area = rects[0].unionall(rects[1:])
             
     def handle_event(self, event):
         """
@@ -49,43 +59,93 @@ class GameOver(BaseState):
             for text, button in self.buttons.items():
                 if button['rect'].collidepoint(event.pos):
                     if text == "Play Again":
-                        self.game.states['game'].reset_game()
+                        self.game.get_state('game').reset_game()
                         self.game.change_state('game')
                     elif text == "Main Menu":
                         self.game.change_state('menu')
                         
-    def update(self):
-        """Update game over screen animations and button states"""
-        self.time += 1/60  # Update animation timer
+    def update(self, dt):
+        """
+        Update game over screen animations and button states
+        
+        Args:
+            dt (float): Length of the simulation tick in seconds
+        """
+        self.time += dt  # Update animation timer
         
         # Update button hover states
         mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons.values():
             button['hover'] = button['rect'].collidepoint(mouse_pos)
             
-    def render(self, screen):
+    def render(self, screen, interpolation=1.0):
+        """
+        Render the game over screen, repainting only the regions that changed
+        
+        Args:
+            screen: Pygame surface to render to
+            interpolation (float): Blend factor between simulation ticks (unused)
+            
+        Returns:
+            list: Rects of the screen that changed, or None after a full redraw
+        """
+        # The pulsing red tint covers the whole window, so a change in its
+        # strength means a full redraw; it moves in coarse steps so that is
+        # rare, and otherwise only the pulsing record message and the buttons change
+        alpha = int(64 + 32 * math.sin(self.time * 2)) // PULSE_ALPHA_STEP * PULSE_ALPHA_STEP
+        hover = tuple(button['hover'] for button in self.buttons.values())
+        if self.full_redraw or alpha != self.pulse_alpha:
+            self.full_redraw = False
+            self.pulse_alpha = alpha
+            self.hover = hover
+            self.drawn_time = self.time
+            self.draw_scene(screen)
+            return None
+            
+        # The record message only pulses when a tick has moved the animation on
+        dirty = []
+        if self.time != self.drawn_time:
+            self.drawn_time = self.time
+            if self.is_new_record():
+                dirty.append(self.record_area)
+        if hover != self.hover:
+            self.hover = hover
+            dirty.append(self.buttons_area)
+        for rect in dirty:
+            screen.set_clip(rect)
+            self.draw_scene(screen)
+        screen.set_clip(None)
+        return dirty
+        
+    def is_new_record(self):
+        """
+        Check whether the last game set the high score
+        
+        Returns:
+            bool: True if the "New High Score!" message should be shown
+        """
+        score = self.game.get_state('game').score
+        return score == self.game.high_score.get_high_score() and score > 0
+        
+    def draw_scene(self, screen):
         """
-        Render the game over screen
+        Draw every layer of the game over screen (limited by the screen's clip rect)
         
         Args:
             screen: Pygame surface to render to
         """
-        # Draw background with pulsing red overlay
-        screen.fill((40, 0, 0))
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((255, 0, 0))
-        alpha = int(64 + 32 * math.sin(self.time * 2))
-        overlay.set_alpha(alpha)
-        screen.blit(overlay, (0, 0))
+        # Draw background with pulsing red overlay, blended into one fill color
+        alpha = self.pulse_alpha
+        screen.fill((40 + (255 - 40) * alpha // 255, 0, 0))
         
         # Draw "Game Over" text with shadow effect
-        game_over_text = self.title_font.render("Game Over", True, WHITE)
+        game_over_text = self.get_text(self.title_font, "Game Over")
         text_rect = game_over_text.get_rect(
             center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//3)
         )
         
         # Draw shadow
-        shadow_surf = self.title_font.render("Game Over", True, (128, 0, 0))
+        shadow_surf = self.get_text(self.title_font, "Game Over", (128, 0, 0))
         shadow_rect = shadow_surf.get_rect(
             center=(WINDOW_WIDTH//2 + 4, WINDOW_HEIGHT//3 + 4)
         )
@@ -93,40 +153,28 @@ class GameOver(BaseState):
         screen.blit(game_over_text, text_rect)
         
         # Get scores
-        score = self.game.states['game'].score
+        score = self.game.get_state('game').score
         high_score = self.game.high_score.get_high_score()
         
         # Draw current score
-        score_text = self.font.render(f"Score: {score}", True, WHITE)
+        score_text = self.get_text(self.font, f"Score: {score}")
         score_rect = score_text.get_rect(
             center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 30)
         )
         screen.blit(score_text, score_rect)
         
         # Draw high score
-        high_score_text = self.font.render(
-            f"High Score: {high_score}", True, WHITE
-        )
+        high_score_text = self.get_text(self.font, f"High Score: {high_score}")
         high_score_rect = high_score_text.get_rect(
             center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 30)
         )
         screen.blit(high_score_text, high_score_rect)
         
         # Draw new high score message with pulsing animation if applicable
-        if score == high_score and score > 0:
-            new_record_text = self.font.render(
-                "New High Score!", True, (255, 255, 0)
-            )
-            new_record_rect = new_record_text.get_rect(
-                center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 90)
-            )
-            # Make it pulse
+        if self.is_new_record():
+            # Make it pulse, using pre-scaled copies of the cached text
             scale = 1 + 0.1 * math.sin(self.time * 4)
-            scaled_text = pygame.transform.scale(
-                new_record_text,
-                (int(new_record_rect.width * scale),
-                 int(new_record_rect.height * scale))
-            )
+            scaled_text = self.get_text(self.font, "New High Score!", (255, 255, 0), scale)
             scaled_rect = scaled_text.get_rect(
                 center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 90)
             )
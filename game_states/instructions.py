@@ -3,6 +3,7 @@ import pygame
 import math
 from utils.constants import *
 from game_states.base_state import BaseState
+from utils.background import AnimatedBackground, grid_pattern
 
 class Instructions(BaseState):
     """
@@ -19,6 +20,8 @@ class Instructions(BaseState):
         """
         super().__init__(game)
         self.time = 0  # For animations
+        # The overlay that keeps the text readable is drawn into the cached background
+        self.background = AnimatedBackground(grid_pattern((128, 128, 128), 127, 50, 10), dim=200)
         self.setup_instructions()
         # Create back button at bottom of screen
         self.back_text, self.back_button = self.create_button(
@@ -44,6 +47,16 @@ class Instructions(BaseState):
             "Try to beat your high score!"
         ]
         
+        # Area the waving instruction lines (all but the title) can cover
+        rects = []
+        for i, line in enumerate(self.instructions[1:], start=1):
+            width, height = self.font.size(line)
+            rects.append(pygame.Rect(0, 0, width, height).move(
+                WINDOW_WIDTH//2 - width//2, 80 + i * 40 - height//2))
+        self.text_area = rects[0].unionall(rects[1:]).inflate(24, 4)
+        self.hover = False
+        self.drawn_time = None  # Animation time of the last drawn frame
+        
     def handle_event(self, event):
         """
         Handle instruction screen input events
@@ -55,46 +68,74 @@ class Instructions(BaseState):
             if self.back_button.collidepoint(event.pos):
                 self.game.change_state('menu')
                 
-    def update(self):
-        """Update instruction screen animations"""
-        self.time += 1/60  # Update animation timer
+    def update(self, dt):
+        """
+        Update instruction screen animations
         
-    def render(self, screen):
+        Args:
+            dt (float): Length of the simulation tick in seconds
         """
-        Render the instructions screen
+        self.time += dt  # Update animation timer
+        
+    def render(self, screen, interpolation=1.0):
+        """
+        Render the instructions screen, repainting only the regions that changed
         
         Args:
             screen: Pygame surface to render to
+            interpolation (float): Blend factor between simulation ticks (unused)
+            
+        Returns:
+            list: Rects of the screen that changed, or None after a full redraw
+        """
+        # Only the background circles, the waving text and the button change
+        background_rect = self.background.prepare(self.time)
+        hover = self.is_button_hovered(self.back_button)
+        if self.full_redraw:
+            self.full_redraw = False
+            self.hover = hover
+            self.drawn_time = self.time
+            self.draw_scene(screen, hover)
+            return None
+            
+        # The text only waves when a tick has moved the animation on
+        dirty = []
+        if self.time != self.drawn_time:
+            self.drawn_time = self.time
+            dirty.append(self.text_area)
+        if hover != self.hover:
+            self.hover = hover
+            dirty.append(self.back_button)
+        if background_rect:
+            # Whatever lies inside the new background frame is repainted with it
+            dirty = [background_rect] + [rect for rect in dirty if not background_rect.contains(rect)]
+        for rect in dirty:
+            screen.set_clip(rect)
+            self.draw_scene(screen, hover)
+        screen.set_clip(None)
+        return dirty
+        
+    def draw_scene(self, screen, hover):
         """
-        # Draw animated background pattern
-        for x in range(0, WINDOW_WIDTH, 100):
-            for y in range(0, WINDOW_HEIGHT, 100):
-                color = (
-                    int(128 + 127 * math.sin(self.time + x / 200)),
-                    int(128 + 127 * math.sin(self.time + y / 150)),
-                    int(128 + 127 * math.cos(self.time * 0.7))
-                )
-                pygame.draw.circle(screen, color, (x, y), 
-                                 50 + 10 * math.sin(self.time * 1.5 + x / 100))
+        Draw every layer of the instructions screen (limited by the screen's clip rect)
         
-        # Draw semi-transparent overlay for better text readability
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(200)
-        screen.blit(overlay, (0, 0))
+        Args:
+            screen: Pygame surface to render to
+            hover (bool): Whether the back button is hovered
+        """
+        # Draw animated background pattern, already darkened for better text readability
+        self.background.render(screen, self.time)
         
         # Draw instructions with animated effects
         for i, line in enumerate(self.instructions):
             if i == 0:  # Title
-                text = self.title_font.render(line, True, WHITE)
+                text = self.get_text(self.title_font, line)
             else:
-                # Add wave effect to regular instructions
-                color = (
-                    255,
-                    255,
-                    int(200 + 55 * math.sin(self.time * 2 + i / 2))
-                )
-                text = self.font.render(line, True, color)
+                # Add wave effect to regular instructions, tinting the cached
+                # white line instead of rendering it again
+                blue = int(200 + 55 * math.sin(self.time * 2 + i / 2))
+                color = (255, 255, blue // TEXT_COLOR_STEP * TEXT_COLOR_STEP)
+                text = self.get_text(self.font, line, color)
             
             # Calculate position with wave effect
             x = WINDOW_WIDTH//2
@@ -107,5 +148,4 @@ class Instructions(BaseState):
             screen.blit(text, rect)
         
         # Draw back button with hover effect
-        hover = self.is_button_hovered(self.back_button)
-        self.draw_button(screen, self.back_text, self.back_button, hover) 
\ No newline at end of file
+        self.draw_button(screen, self.back_text, self.back_button, hover)
@@ -3,6 +3,7 @@ import pygame
 import math
 from utils.constants import *
 from game_states.base_state import BaseState
+from utils.background import AnimatedBackground, tiled_pattern
 
 class Menu(BaseState):
     """
@@ -22,6 +23,14 @@ class Menu(BaseState):
         self.time = 0  # For animations
         self.setup_buttons()
         self.bg_offset = 0  # For background animation
+        self.background = AnimatedBackground(tiled_pattern(self.bg_offset))
+        
+        # Static layers, rendered once and recomposited only when invalidated
+        self.title = self.get_text(self.title_font, "Jelly Ninja")
+        self.title_rect = self.title.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//4))
+        self.high_score_value = None
+        self.high_score_text = None
+        self.buttons_state = None
         
     def setup_buttons(self):
         """Create and position all menu buttons"""
@@ -39,6 +48,9 @@ class Menu(BaseState):
                 'hover': False,
                 'base_y': y_pos  # Store original y position for animation
             }
+        # Area the floating buttons can cover, repainted when they move
+        rects = [button['rect'] for button in self.buttons.values()]
+        self.buttons_area = rects[0].unionall(rects[1:]).inflate(4, 14)
     
     def handle_event(self, event):
         """
@@ -51,69 +63,93 @@ class Menu(BaseState):
             for text, button in self.buttons.items():
                 if button['rect'].collidepoint(event.pos):
                     if text == "Start":
-                        self.game.states['game'].reset_game()
+                        self.game.get_state('game').reset_game()
                         self.game.change_state('game')
                     elif text == "Instructions":
                         self.game.change_state('instructions')
                     elif text == "Quit":
                         self.game.running = False
                         
-    def update(self):
-        """Update menu animations and button states"""
-        self.time += 1/60  # Update animation timer
+    def update(self, dt):
+        """
+        Update menu animations and button states
+        
+        Args:
+            dt (float): Length of the simulation tick in seconds
+        """
+        self.time += dt  # Update animation timer
         
         # Update button hover states
         mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons.values():
             button['hover'] = button['rect'].collidepoint(mouse_pos)
             
-    def render(self, screen):
+    def render(self, screen, interpolation=1.0):
+        """
+        Render the menu screen, repainting only the regions that changed
+        
+        Args:
+            screen: Pygame surface to render to
+            interpolation (float): Blend factor between simulation ticks (unused)
+            
+        Returns:
+            list: Rects of the screen that changed, or None after a full redraw
+        """
+        # Find what changed since the last frame
+        background_rect = self.background.prepare(self.time)
+        high_score = self.game.high_score.get_high_score()
+        if high_score != self.high_score_value:
+            self.high_score_value = high_score
+            self.high_score_text = self.get_text(self.font, f"High Score: {high_score}")
+            self.full_redraw = True
+        # Floating offset for smooth button animation, in whole pixels
+        float_offset = int(math.sin(self.time * 4) * 5)
+        buttons_state = (float_offset, tuple(b['hover'] for b in self.buttons.values()))
+        
+        if self.full_redraw:
+            self.full_redraw = False
+            self.buttons_state = buttons_state
+            self.draw_scene(screen, float_offset)
+            return None
+            
+        dirty = []
+        if background_rect:
+            dirty.append(background_rect)
+        if buttons_state != self.buttons_state:
+            self.buttons_state = buttons_state
+            dirty.append(self.buttons_area)
+        # Recomposite every layer, clipped to each changed region
+        for rect in dirty:
+            screen.set_clip(rect)
+            self.draw_scene(screen, float_offset)
+        screen.set_clip(None)
+        return dirty
+        
+    def draw_scene(self, screen, float_offset):
         """
-        Render the menu screen
+        Draw every layer of the menu (limited by the screen's clip rect)
         
         Args:
             screen: Pygame surface to render to
+            float_offset (int): Vertical offset of the floating buttons
         """
         # Draw animated background circles
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                offset_x = (x * WINDOW_WIDTH + self.bg_offset) % WINDOW_WIDTH
-                offset_y = (y * WINDOW_HEIGHT + self.bg_offset) % WINDOW_HEIGHT
-                color = (
-                    int(128 + 127 * math.sin(self.time + offset_x / 100)),
-                    int(128 + 127 * math.sin(self.time + offset_y / 100)),
-                    int(128 + 127 * math.sin(self.time * 0.5))
-                )
-                pygame.draw.circle(screen, color, 
-                                 (offset_x, offset_y), 
-                                 100 + 20 * math.sin(self.time * 2))
+        self.background.render(screen, self.time)
         
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.get_overlay(180), (0, 0))
         
         # Draw title
-        title = self.title_font.render("Jelly Ninja", True, WHITE)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//4))
-        screen.blit(title, title_rect)
+        screen.blit(self.title, self.title_rect)
         
         # Draw high score
-        high_score_text = self.font.render(
-            f"High Score: {self.game.high_score.get_high_score()}", 
-            True, WHITE
-        )
-        high_score_rect = high_score_text.get_rect(
+        high_score_rect = self.high_score_text.get_rect(
             center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//4 + 80)
         )
-        screen.blit(high_score_text, high_score_rect)
+        screen.blit(self.high_score_text, high_score_rect)
         
         # Draw buttons with hover effects and floating animation
         for button in self.buttons.values():
-            # Calculate floating offset for smooth button animation
-            float_offset = math.sin(self.time * 4) * 5
-            
             # Temporarily move the button for rendering
             button['rect'].centery = button['base_y'] + float_offset
             
@@ -126,4 +162,4 @@ class Menu(BaseState):
             )
             
             # Reset the button position
-            button['rect'].centery = button['base_y'] 
\ No newline at end of file
+            button['rect'].centery = button['base_y']
@@ -10,42 +10,168 @@
 
 
 # Import necessary modules
-import pygame  # Main game library for graphics and input
+import time   # For measuring headless simulation speed and startup time
+IMPORT_START = time.perf_counter()  # Start of the startup timing report
+import os     # For selecting the SDL video driver in headless mode
 import sys    # For system-level operations like exiting the game
-from game_states.menu import Menu                 # Menu screen state
-from game_states.game import Game                 # Main gameplay state
-from game_states.instructions import Instructions # Instructions screen state
-from game_states.game_over import GameOver       # Game over screen state
+import argparse  # For command line options
+import importlib  # For importing state modules on first use
+from concurrent.futures import ThreadPoolExecutor  # For the pipelined simulation thread
+import pygame  # Main game library for graphics and input
 from utils.constants import *                     # Game constants and settings
 from utils.high_score import HighScore           # High score management
+from utils.profiler import FrameProfiler         # Per-frame phase timing
+from utils.replay import Replay                   # Input recording and playback
+from utils.quality import QualityGovernor         # Frame-time driven quality presets
+from utils.render_backend import create_backend   # Software or SDL texture rendering
+from utils.latency import LatencyTracker          # Input-to-photon latency histograms
+IMPORT_END = time.perf_counter()
+
+# Module and class of every game state. States are imported and built on
+# first use, so startup only pays for the menu.
+STATE_CLASSES = {
+    'menu': ('game_states.menu', 'Menu'),                         # Menu screen state
+    'game': ('game_states.game', 'Game'),                         # Main gameplay state
+    'instructions': ('game_states.instructions', 'Instructions'), # Instructions screen state
+    'game_over': ('game_states.game_over', 'GameOver')            # Game over screen state
+}
 
 class JellyNinja:
     """
     Main game class that manages the game states and main loop.
     Handles initialization, state switching, and game execution.
     """
-    def __init__(self):
-        """Initialize the game, create window, and set up game states"""
+    def __init__(self, headless=False, seed=None, render=True, profile_out=None, record=None,
+                 quality='auto', renderer='software', latency_log=None, loop_order='standard',
+                 pipeline=False):
+        """
+        Initialize the game, create window, and set up game states
+        
+        Args:
+            headless (bool): Run without a window; drive the game with step()
+                or simulate() instead of run()
+            seed (int): Seed for gameplay randomness, or None for a new one per game
+            render (bool): In headless mode, whether to render frames at all
+            profile_out (str): Write frame timings to this .csv or .json file at exit
+            record (str): Save a replay of every game to this path; a {game}
+                placeholder is replaced by the game number
+            quality (str): One of QUALITY_LEVELS, or 'auto' to start high and
+                adapt to the measured frame time
+            renderer (str): One of RENDERERS; 'auto' and 'texture' draw gameplay
+                with an SDL renderer and fall back to software blitting
+            latency_log (str): Append every measured input latency to this file
+            loop_order (str): One of LOOP_ORDERS; 'late-latch' takes input that
+                arrived during the simulation ticks into the frame being rendered
+            pipeline (bool): During gameplay, simulate each frame's ticks on a
+                worker thread while the main thread draws the previous frame
+        """
+        self.headless = headless
+        self.seed = seed
+        # (phase, milliseconds) for the startup timing report
+        self.startup_times = [('imports', (IMPORT_END - IMPORT_START) * 1000)]
+        self.startup_mark = time.perf_counter()
+        
         # Initialize Pygame
+        if headless:
+            # The dummy driver lets the display and mouse modules work with no window
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
         pygame.init()
-        pygame.display.set_caption("Jelly Ninja")
+        self.mark_startup('pygame.init')
         
-        # Create the game window and clock
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # Create the game window (or an offscreen surface) and clock
+        if headless:
+            self.backend = None
+            self.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)) if render else None
+        else:
+            self.backend = create_backend(renderer, (WINDOW_WIDTH, WINDOW_HEIGHT), "Jelly Ninja")
+            self.screen = self.backend.screen
+        self.mark_startup('display')
         self.clock = pygame.time.Clock()
         self.running = True
+        self.accumulator = 0.0  # Real time not yet simulated, in seconds
         self.current_state = None
-        self.high_score = HighScore()
-        
-        # Initialize all game states
-        self.states = {
-            'menu': Menu(self),
-            'game': Game(self),
-            'instructions': Instructions(self),
-            'game_over': GameOver(self)
-        }
+        self.current_state_name = None
+        # Headless runs are simulations, so they keep their scores out of the saved leaderboard
+        self.high_score = HighScore(path=None) if headless else HighScore()
+        self.profiler = FrameProfiler()
+        self.profile_out = profile_out
+        # Headless runs have no frame budget to keep, so they never adapt
+        adaptive = quality == 'auto' and not headless
+        self.quality = QualityGovernor('high' if quality == 'auto' else quality, adaptive)
+        self.record_path = record
+        self.replays_saved = 0
+        self.latency = LatencyTracker(log_path=latency_log)
+        self.loop_order = loop_order
+        # Pipelined mode: the simulation thread, and the (snapshot, interpolation,
+        # ticks it covers) to draw next frame
+        self.worker = None
+        if pipeline and not headless:
+            self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='simulation')
+        self.pending_frame = None
+        
+        # Game states that have been built so far, by name
+        self.states = {}
         # Start with the menu state
         self.change_state('menu')
+        self.mark_startup('first state')
+
+    def apply_quality(self):
+        """Pass the current quality preset to every state built so far"""
+        settings = self.quality.settings
+        for state in self.states.values():
+            state.apply_quality(settings)
+        self.current_state.full_redraw = True
+        
+    def render_target(self):
+        """
+        Get what the current state should render onto
+
+        Returns:
+            The screen surface, or the backend's texture canvas for states that support it
+        """
+        if self.backend is None:
+            return self.screen
+        return self.backend.target(self.current_state)
+
+    def mark_startup(self, phase):
+        """
+        Charge the time since the previous mark to a startup phase
+        
+        Args:
+            phase (str): Name of the phase that just finished
+        """
+        now = time.perf_counter()
+        self.startup_times.append((phase, (now - self.startup_mark) * 1000))
+        self.startup_mark = now
+        
+    def startup_report(self):
+        """
+        Build the startup timing report
+        
+        Returns:
+            str: One line per startup phase, plus the total, in milliseconds
+        """
+        lines = [f"{phase:<12}{ms:8.1f} ms" for phase, ms in self.startup_times]
+        total = sum(ms for _, ms in self.startup_times)
+        lines.append(f"{'total':<12}{total:8.1f} ms")
+        return "\n".join(lines)
+        
+    def get_state(self, name):
+        """
+        Get a game state, importing and building it on first use
+        
+        Args:
+            name (str): Name of the state
+            
+        Returns:
+            BaseState: The state object
+        """
+        state = self.states.get(name)
+        if state is None:
+            module_name, class_name = STATE_CLASSES[name]
+            state_class = getattr(importlib.import_module(module_name), class_name)
+            state = self.states[name] = state_class(self)
+        return state
 
     def change_state(self, new_state):
         """
@@ -53,35 +179,394 @@ class JellyNinja:
         Args:
             new_state (str): Name of the state to switch to
         """
-        self.current_state = self.states[new_state]
+        if self.current_state is not None:
+            self.current_state.exit()
+        self.current_state = self.get_state(new_state)
+        self.current_state_name = new_state
         self.current_state.enter()
 
     def run(self):
-        """Main game loop that handles events, updates, and rendering"""
-        while self.running:
-            # Maintain consistent frame rate
-            self.clock.tick(FPS)
-            
-            # Process all events
-            for event in pygame.event.get():
-                # Check for game exit
-                if event.type == pygame.QUIT:
-                    self.running = False
-                # Pass events to current state
-                self.current_state.handle_event(event)
+        """
+        Main game loop that handles events, updates, and rendering.
+        The simulation advances in fixed SIM_DT ticks driven by the real
+        frame delta, and each frame is rendered interpolated between the
+        last two ticks.
+        """
+        profiler = self.profiler
+        try:
+            while self.running:
+                # Cap the frame rate and measure the real time since the last frame
+                frame_time = self.clock.tick(FPS) / 1000
+                # Clamp long stalls so the simulation doesn't spiral trying to catch up
+                self.accumulator += min(frame_time, MAX_FRAME_TIME)
+                profiler.start_frame()
             
-            # Update and render current state
-            self.current_state.update()
-            self.current_state.render(self.screen)
+                # Process all events
+                events = pygame.event.get()
+                drained = time.perf_counter()
+                self.handle_events(events)
+                profiler.lap('events')
             
-            # Update display
-            pygame.display.flip()
+                # Count the fixed simulation ticks the elapsed time covers
+                ticks = 0
+                while self.accumulator >= SIM_DT:
+                    self.accumulator -= SIM_DT
+                    ticks += 1
+                
+                if self.worker is not None and self.current_state.supports_snapshot:
+                    self.pipelined_frame(ticks, events, drained)
+                else:
+                    self.pending_frame = None
+                    self.latency.drained(events, drained)
+                    for _ in range(ticks):
+                        self.current_state.update(SIM_DT)
+                    profiler.lap('update')
+                
+                    # Take input that arrived while simulating into this frame too
+                    if self.loop_order == 'late-latch':
+                        events = pygame.event.get()
+                        self.latency.drained(events, after_ticks=True)
+                        self.handle_events(events)
+                        profiler.lap('events')
+                    
+                    # Render between the last two ticks
+                    target = self.render_target()
+                    self.present(self.current_state.render(target, self.accumulator / SIM_DT), target)
+                    self.latency.presented(ticks)
+                if self.quality.observe(profiler.current.sum()):
+                    self.apply_quality()
+                profiler.end_frame(self.current_state_name, self.current_state.get_counts())
+        except Exception:
+            # Keep what led up to the crash for debugging, then crash as usual
+            path = self.dump_crash()
+            if path:
+                print(f"Saved the game's recent states to {path}", file=sys.stderr)
+            raise
 
         # Clean up and exit
+        self.shutdown()
         pygame.quit()
         sys.exit()
+        
+    def dump_crash(self, path=CRASH_DUMP_FILE):
+        """
+        Write the recent snapshots of the game in progress to a file
+        
+        Args:
+            path (str): File to write
+            
+        Returns:
+            str: The path written, or None if there was nothing to write
+        """
+        game = self.states.get('game')
+        if game is None:
+            return None
+        latest = game.rewind.latest()
+        try:
+            if latest is None or latest[0] != game.ticks:
+                game.rewind.push(game.ticks, game.save_state())
+        except Exception:
+            pass  # The current state may be what is broken; the older ones still help
+        if not len(game.rewind):
+            return None
+        try:
+            game.rewind.dump(path)
+        except OSError:
+            return None
+        return path
+        
+    def present(self, dirty, target):
+        """
+        Draw the profiler overlay and show a rendered frame
+        
+        Args:
+            dirty (list): Rects the state changed, or None for the whole frame
+            target: What the frame was rendered onto
+        """
+        panel = self.profiler.draw(target)
+        if dirty is not None and panel is not None:
+            dirty.append(panel)
+        self.profiler.lap('render')
+        
+        # Update display, pushing only the changed rects when the state reported them
+        self.backend.present(dirty, target)
+        self.profiler.lap('flip')
+        
+    def pipelined_frame(self, ticks, events, drained):
+        """
+        Run one frame with the simulation on the worker thread. This frame's
+        ticks run there while the snapshot from the previous frame is drawn,
+        so what is shown lags the simulation by one frame; the simulation
+        itself, and so the game's results, are exactly the same.
+        
+        Args:
+            ticks (int): Simulation ticks to run this frame
+            events (list): Events handled this frame
+            drained (float): time.perf_counter() when the events were taken
+        """
+        state = self.current_state
+        if self.pending_frame is None:
+            # Built now so the worker never creates surfaces while this thread draws
+            self.get_state('game_over')
+            self.pending_frame = (state.snapshot(), 1.0, 0)
+        snapshot, interpolation, shown_ticks = self.pending_frame
+        future = self.worker.submit(self.advance, state, ticks)
+        
+        target = self.render_target()
+        self.present(state.render_snapshot(target, snapshot, interpolation), target)
+        # The frame shown covers input up to the previous frame
+        self.latency.presented(shown_ticks)
+        self.latency.drained(events, drained)
+        
+        # Wait for the worker; only time it was not hidden behind drawing counts as update
+        snapshot, leftover = future.result()
+        self.profiler.lap('update')
+        for _ in range(leftover):
+            self.current_state.update(SIM_DT)
+        self.pending_frame = None
+        if snapshot is not None:
+            self.pending_frame = (snapshot, self.accumulator / SIM_DT, ticks)
+        
+    def advance(self, state, ticks):
+        """
+        Run simulation ticks and snapshot the result (on the worker thread)
+        
+        Args:
+            state: State to update
+            ticks (int): Number of ticks to run
+            
+        Returns:
+            tuple: (snapshot, ticks left). If the state changed part way (e.g.
+                a bomb ended the game), the snapshot is None and the remaining
+                ticks are left for the main thread to run on the new state.
+        """
+        for tick in range(ticks):
+            state.update(SIM_DT)
+            if self.current_state is not state:
+                return None, ticks - tick - 1
+        return state.snapshot(), 0
+        
+    def handle_events(self, events):
+        """
+        Handle events taken from the queue in the main loop
+        
+        Args:
+            events (list): Events returned by pygame.event.get()
+        """
+        for event in events:
+            # Check for game exit
+            if event.type == pygame.QUIT:
+                self.running = False
+            # Toggle the timing overlay
+            elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                self.profiler.toggle()
+                self.current_state.full_redraw = True
+            # The window contents were lost, so repaint everything
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.current_state.full_redraw = True
+            # Pass events to current state
+            self.current_state.handle_event(event)
+        
+    def shutdown(self):
+        """Write out anything that should outlive the process"""
+        # Let the active state finish up (e.g. save the replay of a game in progress)
+        if self.current_state is not None:
+            self.current_state.exit()
+        if self.profile_out:
+            self.profiler.export(self.profile_out)
+        self.latency.close()
+        if self.worker is not None:
+            self.worker.shutdown()
+        self.high_score.flush()
+        
+    def step(self, events=()):
+        """
+        Advance the game by exactly one simulation tick, without waiting
+        
+        Args:
+            events (iterable): Pygame events to handle before the tick
+        """
+        profiler = self.profiler
+        profiler.start_frame()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            self.current_state.handle_event(event)
+        profiler.lap('events')
+        self.current_state.update(SIM_DT)
+        profiler.lap('update')
+        if self.screen is not None:
+            target = self.render_target()
+            self.current_state.render(target)
+            profiler.lap('render')
+            if self.backend is not None:
+                self.backend.present(None, target)
+        profiler.end_frame(self.current_state_name, self.current_state.get_counts())
+            
+    def simulate(self, ticks, script=None, until_game_over=True):
+        """
+        Run the game as fast as possible for a number of ticks (headless mode)
+        
+        Args:
+            ticks (int): Maximum number of ticks to run
+            script: Optional function mapping a tick number to a list of
+                events to feed in before that tick
+            until_game_over (bool): Stop early when the game over screen appears
+            
+        Returns:
+            int: Number of ticks actually run
+        """
+        game_over = self.get_state('game_over')
+        for tick in range(ticks):
+            self.step(script(tick) if script is not None else ())
+            if not self.running or (until_game_over and self.current_state is game_over):
+                return tick + 1
+        return ticks
+        
+    def save_replay(self, replay):
+        """
+        Save a finished game's replay if recording is enabled
+        
+        Args:
+            replay (Replay): Recording of the game
+        """
+        if not self.record_path:
+            return
+        self.replays_saved += 1
+        replay.save(self.record_path.format(game=self.replays_saved))
+        
+    def play_replay(self, replay, realtime=False):
+        """
+        Play a recorded game back from the start
+        
+        Args:
+            replay (Replay): Recording to play
+            realtime (bool): Pace playback at TICK_RATE (and show it if there
+                is a window) instead of running as fast as possible
+                
+        Returns:
+            int: Number of ticks played
+        """
+        self.seed = replay.seed
+        self.start_game()
+        script = replay.script()
+        # A game ended by a bomb ends during its last tick, before the tick
+        # counter moves on; a game that was quit stops after its last tick
+        ticks = replay.ticks + 1 if replay.game_over else replay.ticks
+        if not realtime:
+            return self.simulate(ticks, script)
+            
+        game_over = self.get_state('game_over')
+        tick = 0
+        while self.running and tick < ticks and self.current_state is not game_over:
+            self.clock.tick(TICK_RATE)
+            # Only window events are taken live; input comes from the recording
+            for event in pygame.event.get(pygame.QUIT):
+                self.running = False
+            self.step(script(tick))
+            tick += 1
+        return tick
+        
+    def start_game(self):
+        """Start a fresh game directly, skipping the menu"""
+        self.get_state('game').reset_game()
+        self.change_state('game')
+
+def seed_arg(text):
+    """
+    Parse a --seed value
+    
+    Args:
+        text (str): Seed given on the command line
+        
+    Returns:
+        int: The seed
+        
+    Raises:
+        argparse.ArgumentTypeError: If the seed is not an integer, or is outside
+            0..MAX_SEED (NumPy's generators refuse negative seeds, and snapshots
+            and replays store it in 64 bits)
+    """
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"seed must be an integer, got {text!r}")
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {MAX_SEED}, got {seed}")
+    return seed
+
+def parse_args(argv=None):
+    """
+    Parse command line options
+    
+    Args:
+        argv (list): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Jelly Ninja")
+    parser.add_argument('--headless', action='store_true',
+                        help="simulate a game without a window, as fast as possible")
+    parser.add_argument('--seed', type=seed_arg, default=None,
+                        help="seed for gameplay randomness")
+    parser.add_argument('--ticks', type=int, default=TICK_RATE * 60,
+                        help="ticks to simulate in headless mode")
+    parser.add_argument('--render', action='store_true',
+                        help="render frames offscreen in headless mode")
+    parser.add_argument('--profile-out', metavar='PATH', default=None,
+                        help="write per-frame timings to a .csv or .json file at exit")
+    parser.add_argument('--record', metavar='PATH', default=None,
+                        help="save a replay of every game ({game} in PATH is replaced by its number)")
+    parser.add_argument('--replay', metavar='PATH', default=None,
+                        help="play back a recorded game (as fast as possible with --headless)")
+    parser.add_argument('--quality', choices=QUALITY_LEVELS + ('auto',), default='auto',
+                        help="effects quality preset ('auto' adapts to the frame time)")
+    parser.add_argument('--renderer', choices=RENDERERS, default='software',
+                        help="draw with CPU blits, or an SDL texture renderer "
+                             "('auto' only uses one that is hardware accelerated)")
+    parser.add_argument('--latency-log', metavar='PATH', default=None,
+                        help="append every measured input-to-screen latency to a file")
+    parser.add_argument('--loop-order', choices=LOOP_ORDERS, default='standard',
+                        help="'late-latch' also takes input that arrived during the update "
+                             "into the frame being rendered")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="simulate gameplay on a worker thread while the previous frame is drawn")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="print how long each startup phase took")
+    return parser.parse_args(argv)
 
 # Only run the game if this file is run directly
 if __name__ == "__main__":
-    game = JellyNinja()
-    game.run() 
\ No newline at end of file
+    args = parse_args()
+    if args.headless:
+        game = JellyNinja(headless=True, seed=args.seed, render=args.render,
+                          profile_out=args.profile_out, record=args.record, quality=args.quality)
+        if args.replay:
+            replay = Replay.load(args.replay)
+            start = time.perf_counter()
+            ticks = game.play_replay(replay)
+        else:
+            game.start_game()
+            start = time.perf_counter()
+            ticks = game.simulate(args.ticks)
+        elapsed = time.perf_counter() - start
+        print(f"Simulated {ticks} ticks in {elapsed:.3f}s "
+              f"({ticks / max(elapsed, 1e-9):.0f} ticks/s), "
+              f"score {game.get_state('game').score}")
+        if args.startup_report:
+            print(game.startup_report())
+        game.shutdown()
+    else:
+        game = JellyNinja(seed=args.seed, profile_out=args.profile_out, record=args.record,
+                          quality=args.quality, renderer=args.renderer,
+                          latency_log=args.latency_log, loop_order=args.loop_order,
+                          pipeline=args.pipeline)
+        if args.startup_report:
+            print(game.startup_report())
+        if args.replay:
+            game.play_replay(Replay.load(args.replay), realtime=True)
+            game.shutdown()
+            pygame.quit()
+        else:
+            game.run() 
\ No newline at end of file
@@ -0,0 +1,252 @@
+# sweep.py
+#
+# Balance sweep for Jelly Ninja: plays many seeded headless games for every
+# combination of tuning values on a process pool (one worker per core) and
+# writes per-game results and per-setting aggregates to a columnar .npz file.
+#
+# Example:
+#   python sweep.py --games 200 --set spawn_interval=0.9,1.2,1.5 --set bomb_chance=0.2,0.3
+
+
+# Import necessary modules
+import os         # For the worker count and SDL driver
+import time       # For measuring simulation speed
+import argparse   # For command line options
+import itertools  # For expanding the parameter grid
+import multiprocessing  # For running games on every core
+import numpy as np      # For the columnar output file
+from utils.constants import *
+
+# Per-game result columns, in row order
+COLUMNS = ('config', 'seed', 'score', 'ticks', 'survival',
+           'peak_jellies', 'peak_bombs', 'peak_particles', 'ticks_per_second')
+
+# Headless game owned by each worker process
+_app = None
+
+
+def parse_grid(specs):
+    """
+    Expand NAME=V1,V2,... options into every combination of tuning values
+    
+    Args:
+        specs (list): Strings such as "spawn_interval=0.9,1.2"
+        
+    Returns:
+        tuple: (names, configs) where configs is a list of value tuples
+        
+    Raises:
+        ValueError: If a name is not a tunable Game setting
+    """
+    from game_states.game import Game
+    names = []
+    values = []
+    for spec in specs:
+        name, _, listed = spec.partition('=')
+        if name not in Game.TUNING:
+            raise ValueError(f"unknown setting {name!r}; choose from {', '.join(Game.TUNING)}")
+        names.append(name)
+        values.append([float(v) for v in listed.split(',') if v])
+    return names, list(itertools.product(*values))
+
+
+def init_worker():
+    """Create the headless game each worker reuses for all of its games"""
+    global _app
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import main
+    _app = main.JellyNinja(headless=True, render=False)
+
+
+def play(task):
+    """
+    Play one seeded game with one set of tuning values
+    
+    Args:
+        task (tuple): (config index, {setting: value}, seed, max ticks,
+            player name, replay path or None)
+            
+    Returns:
+        tuple: One row of COLUMNS
+    """
+    config, settings, seed, max_ticks, player_name, replay_path = task
+    app = _app
+    app.seed = seed
+    game = app.get_state('game')
+    for name, value in settings.items():
+        setattr(game, name, value)
+    app.start_game()
+    game_over = app.get_state('game_over')
+    
+    # Pick where the input comes from
+    if replay_path:
+        from utils.replay import Replay
+        script = Replay.load(replay_path).script()
+        next_events = lambda tick: script(tick)
+    elif player_name == 'synthetic':
+        from utils.synthetic_player import SyntheticPlayer
+        player = SyntheticPlayer(seed)
+        next_events = lambda tick: player.events(game)
+    else:
+        next_events = lambda tick: ()
+        
+    peaks = [0, 0, 0]
+    start = time.perf_counter()
+    ticks = max_ticks
+    for tick in range(max_ticks):
+        app.step(next_events(tick))
+        counts = game.get_counts()
+        peaks = [max(peaks[0], counts['jellies']), max(peaks[1], counts['bombs']),
+                 max(peaks[2], counts['particles'])]
+        if app.current_state is game_over:
+            ticks = tick + 1
+            break
+    elapsed = time.perf_counter() - start
+    return (config, seed, game.score, ticks, ticks / TICK_RATE,
+            peaks[0], peaks[1], peaks[2], ticks / max(elapsed, 1e-9))
+
+
+def run_sweep(names, configs, games, seed=0, max_ticks=TICK_RATE * 300,
+              player='synthetic', replay=None, workers=None):
+    """
+    Play every configuration for a number of seeded games
+    
+    Every configuration uses the same seeds, so differences between them
+    come from the tuning values and not from luck.
+    
+    Args:
+        names (list): Tuning setting names
+        configs (list): Value tuples, one per configuration
+        games (int): Games per configuration
+        seed (int): Seed of the first game
+        max_ticks (int): Longest a game may run
+        player (str): 'synthetic' or 'idle'
+        replay (str): Replay file whose input is fed to every game instead
+        workers (int): Worker processes, or None for one per core
+        
+    Returns:
+        numpy.ndarray: One row of COLUMNS per game, sorted by config and seed
+    """
+    tasks = [(c, dict(zip(names, values)), seed + g, max_ticks, player, replay)
+             for c, values in enumerate(configs) for g in range(games)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        init_worker()
+        rows = [play(task) for task in tasks]
+    else:
+        # Fresh interpreters instead of forks: forking after pygame and numpy
+        # have started their threads can deadlock the workers
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(workers, initializer=init_worker) as pool:
+            chunk = max(1, len(tasks) // (workers * 8))
+            rows = list(pool.imap_unordered(play, tasks, chunksize=chunk))
+    rows = np.array(sorted(rows), dtype=np.float64)
+    return rows.reshape(-1, len(COLUMNS))
+
+
+def aggregate(names, configs, rows):
+    """
+    Summarize the games of every configuration
+    
+    Args:
+        names (list): Tuning setting names
+        configs (list): Value tuples, one per configuration
+        rows (numpy.ndarray): Result of run_sweep()
+        
+    Returns:
+        dict: Columns with one entry per configuration
+    """
+    column = {name: i for i, name in enumerate(COLUMNS)}
+    summary = {f'config_{name}': np.array([values[i] for values in configs]) for i, name in enumerate(names)}
+    stats = {'games': [], 'score_mean': [], 'score_std': [], 'survival_mean': [],
+             'survival_p50': [], 'peak_jellies_max': [], 'peak_bombs_max': [],
+             'peak_particles_max': [], 'ticks_per_second_mean': []}
+    for c in range(len(configs)):
+        games = rows[rows[:, column['config']] == c]
+        stats['games'].append(len(games))
+        stats['score_mean'].append(games[:, column['score']].mean())
+        stats['score_std'].append(games[:, column['score']].std())
+        stats['survival_mean'].append(games[:, column['survival']].mean())
+        stats['survival_p50'].append(np.median(games[:, column['survival']]))
+        stats['peak_jellies_max'].append(games[:, column['peak_jellies']].max())
+        stats['peak_bombs_max'].append(games[:, column['peak_bombs']].max())
+        stats['peak_particles_max'].append(games[:, column['peak_particles']].max())
+        stats['ticks_per_second_mean'].append(games[:, column['ticks_per_second']].mean())
+    summary.update({f'config_{name}': np.array(values) for name, values in stats.items()})
+    return summary
+
+
+def save(path, names, configs, rows):
+    """
+    Write per-game columns and per-configuration aggregates to a .npz file
+    
+    Args:
+        path (str): File to write
+        names (list): Tuning setting names
+        configs (list): Value tuples, one per configuration
+        rows (numpy.ndarray): Result of run_sweep()
+    """
+    columns = {name: rows[:, i] for i, name in enumerate(COLUMNS)}
+    config = rows[:, 0].astype(np.int64)
+    columns['config'] = config
+    # The tuning values each game was played with
+    for i, name in enumerate(names):
+        columns[f'setting_{name}'] = np.array([values[i] for values in configs])[config]
+    columns.update(aggregate(names, configs, rows))
+    np.savez_compressed(path, **columns)
+
+
+def parse_args(argv=None):
+    """
+    Parse command line options
+    
+    Args:
+        argv (list): Arguments to parse, or None for sys.argv
+        
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    from main import seed_arg
+    parser = argparse.ArgumentParser(description="Jelly Ninja balance sweep")
+    parser.add_argument('--set', dest='settings', action='append', default=[], metavar='NAME=V1,V2',
+                        help="tuning values to sweep (repeat for a grid)")
+    parser.add_argument('--games', type=int, default=100,
+                        help="seeded games per configuration")
+    parser.add_argument('--seed', type=seed_arg, default=0,
+                        help="seed of the first game")
+    parser.add_argument('--max-ticks', type=int, default=TICK_RATE * 300,
+                        help="longest a game may run, in ticks")
+    parser.add_argument('--player', choices=('synthetic', 'idle'), default='synthetic',
+                        help="who plays the games")
+    parser.add_argument('--replay', metavar='PATH', default=None,
+                        help="feed the input of a recorded game to every game instead")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per core)")
+    parser.add_argument('--out', default='sweep.npz',
+                        help="columnar output file")
+    args = parser.parse_args(argv)
+    if args.seed + args.games - 1 > MAX_SEED:
+        parser.error(f"--seed plus --games must stay within {MAX_SEED}")
+    return args
+
+
+# Only run the sweep if this file is run directly
+if __name__ == "__main__":
+    args = parse_args()
+    names, configs = parse_grid(args.settings)
+    start = time.perf_counter()
+    rows = run_sweep(names, configs, args.games, args.seed, args.max_ticks,
+                     args.player, args.replay, args.workers)
+    elapsed = time.perf_counter() - start
+    save(args.out, names, configs, rows)
+    
+    # Print the per-configuration summary
+    summary = aggregate(names, configs, rows)
+    header = ''.join(f"{name:>22}" for name in names)
+    print(f"{header}{'score':>9}{'survival':>10}{'ticks/s':>10}")
+    for c, values in enumerate(configs):
+        settings = ''.join(f"{value:>22g}" for value in values)
+        print(f"{settings}{summary['config_score_mean'][c]:9.1f}"
+              f"{summary['config_survival_mean'][c]:9.1f}s"
+              f"{summary['config_ticks_per_second_mean'][c]:10.0f}")
+    print(f"{len(rows)} games in {elapsed:.1f}s, written to {args.out}")
@@ -0,0 +1,36 @@
+# Import required modules
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import argparse
+import pytest
+import main
+from utils.constants import *
+from utils.replay import Replay
+from utils.state_snapshot import RewindBuffer
+
+
+def test_seed_arg_range():
+    """Seeds outside 0..MAX_SEED are rejected on the command line"""
+    assert main.parse_args(['--seed', str(MAX_SEED)]).seed == MAX_SEED
+    for bad in ('-1', str(MAX_SEED + 1), 'x'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            main.seed_arg(bad)
+
+
+def test_largest_seed_snapshots_and_replays(tmp_path):
+    """A game seeded with MAX_SEED can be snapshotted, dumped and replayed"""
+    app = main.JellyNinja(headless=True, seed=MAX_SEED, render=False)
+    app.start_game()
+    app.simulate(REWIND_INTERVAL * 5, until_game_over=False)
+    game = app.get_state('game')
+    snapshot = game.save_state()
+    game.restore_state(snapshot)
+    assert game.seed == MAX_SEED and game.save_state() == snapshot
+
+    # Crash dumps hold the same snapshots
+    path = app.dump_crash(str(tmp_path / 'crash.bin'))
+    assert path is not None and len(RewindBuffer.load(path))
+
+    # Replays keep the seed through a save and load
+    game.replay.save(str(tmp_path / 'game.jnr'))
+    assert Replay.load(str(tmp_path / 'game.jnr')).seed == MAX_SEED
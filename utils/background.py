@@ -0,0 +1,147 @@
+# Import required modules
+import pygame
+import numpy as np
+from utils.constants import *
+from utils.render_backend import mark_changed
+
+
+def grid_pattern(base, amplitude, radius, radius_amplitude, spacing=100):
+    """
+    Pattern of pulsing circles on a regular grid (game and instructions screens)
+
+    Args:
+        base (tuple): Base RGB color of the circles
+        amplitude (float): How far each color channel swings from its base
+        radius (float): Base circle radius in pixels
+        radius_amplitude (float): How far the radius swings from its base
+        spacing (int): Distance between circle centers in pixels
+
+    Returns:
+        function: Maps a time in seconds to (centers, colors, sizes)
+    """
+    # Column-major order matches the original nested x/y drawing loops
+    xs, ys = np.meshgrid(np.arange(0, WINDOW_WIDTH, spacing),
+                         np.arange(0, WINDOW_HEIGHT, spacing), indexing='ij')
+    xs = xs.ravel()
+    ys = ys.ravel()
+    centers = list(zip(xs.tolist(), ys.tolist()))
+
+    def pattern(time):
+        colors = np.empty((len(centers), 3))
+        colors[:, 0] = base[0] + amplitude * np.sin(time + xs / 200)
+        colors[:, 1] = base[1] + amplitude * np.sin(time + ys / 150)
+        colors[:, 2] = base[2] + amplitude * np.cos(time * 0.7)
+        sizes = radius + radius_amplitude * np.sin(time * 1.5 + xs / 100)
+        return centers, colors.astype(int).tolist(), sizes.tolist()
+
+    return pattern
+
+
+def tiled_pattern(offset=0):
+    """
+    Pattern of large circles tiled around the window edges (menu screen)
+
+    Args:
+        offset (int): Scroll offset of the tiling in pixels
+
+    Returns:
+        function: Maps a time in seconds to (centers, colors, sizes)
+    """
+    tiles = np.array([(x, y) for x in range(-1, 2) for y in range(-1, 2)])
+    xs = (tiles[:, 0] * WINDOW_WIDTH + offset) % WINDOW_WIDTH
+    ys = (tiles[:, 1] * WINDOW_HEIGHT + offset) % WINDOW_HEIGHT
+    centers = list(zip(xs.tolist(), ys.tolist()))
+
+    def pattern(time):
+        colors = np.empty((len(centers), 3))
+        colors[:, 0] = 128 + 127 * np.sin(time + xs / 100)
+        colors[:, 1] = 128 + 127 * np.sin(time + ys / 100)
+        colors[:, 2] = 128 + 127 * np.sin(time * 0.5)
+        sizes = np.full(len(centers), 100 + 20 * np.sin(time * 2))
+        return centers, colors.astype(int).tolist(), sizes.tolist()
+
+    return pattern
+
+
+class AnimatedBackground:
+    """
+    Animated circle background shared by the game, menu and instructions.
+    Circle colors and sizes for a frame are computed in one vectorized
+    pass, and the finished frame is cached and reused until the quantized
+    animation time moves on, so most frames cost a single blit.
+    """
+
+    def __init__(self, pattern, fill=BLACK, fps=BACKGROUND_FPS, dim=0):
+        """
+        Initialize the background
+
+        Args:
+            pattern: Function mapping time to (centers, colors, sizes)
+            fill (tuple): RGB color behind the circles
+            fps (int): How many distinct background frames to draw per second
+            dim (int): Opacity of a black overlay drawn into every frame (0 for
+                none), so screens that darken the background blit it only once
+        """
+        self.pattern = pattern
+        self.fill = fill
+        self.fps = fps
+        self.dim = dim
+        self.surface = None
+        self.overlay = None  # Black surface blended over each frame when dimming
+        self.frame_step = None  # Quantized time of the cached frame
+        self.circles_rect = None  # Area covered by the cached frame's circles
+
+    def invalidate(self):
+        """Force the next render to redraw the cached frame"""
+        self.frame_step = None
+
+    def prepare(self, time):
+        """
+        Bring the cached frame up to date for a point in time
+
+        Args:
+            time (float): Animation time in seconds
+
+        Returns:
+            pygame.Rect: Area of the frame that changed, or None if the
+                cached frame was already current
+        """
+        step = int(time * self.fps)
+        if step == self.frame_step:
+            return None
+        previous = self.circles_rect
+        self._draw_frame(step / self.fps)
+        self.frame_step = step
+        if previous is None:
+            return self.surface.get_rect()
+        return previous.union(self.circles_rect)
+
+    def render(self, screen, time):
+        """
+        Draw the background for a point in time
+
+        Args:
+            screen: Surface to draw on
+            time (float): Animation time in seconds
+        """
+        self.prepare(time)
+        screen.blit(self.surface, (0, 0))
+
+    def _draw_frame(self, time):
+        """Redraw the cached frame for a quantized time"""
+        if self.surface is None:
+            self.surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+        surface = self.surface
+        surface.fill(self.fill)
+        centers, colors, sizes = self.pattern(time)
+        rects = [pygame.draw.circle(surface, color, center, size)
+                 for center, color, size in zip(centers, colors, sizes)]
+        self.circles_rect = rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+        if self.dim:
+            if self.overlay is None:
+                self.overlay = pygame.Surface(surface.get_size())
+                self.overlay.set_alpha(self.dim)
+            surface.blit(self.overlay, (0, 0))
+        mark_changed(surface)
@@ -0,0 +1,51 @@
+# Import required modules
+import numpy as np
+
+
+def polyline_circle_hits(points, cx, cy, radius, hit_scale=1.0):
+    """
+    Test every segment of a polyline against every circle in one pass
+
+    Args:
+        points (sequence): (x, y) points of the polyline, in swipe order
+        cx, cy (numpy.ndarray): Circle centers
+        radius (numpy.ndarray): Circle radii
+        hit_scale (float): Multiplier on radius squared (enlarged hit box)
+
+    Returns:
+        tuple: (circles, segments) arrays. circles holds the index of every
+            circle the polyline touches, in the order the swipe reaches
+            them; segments holds the first segment touching each one.
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    if len(points) < 2 or len(cx) == 0:
+        return empty, empty
+    pts = np.asarray(points, dtype=np.float64)
+    start_x = pts[:-1, 0, None]
+    start_y = pts[:-1, 1, None]
+    vx = pts[1:, 0, None] - start_x
+    vy = pts[1:, 1, None] - start_y
+
+    # Vector from each segment start to each circle center
+    to_x = np.asarray(cx, dtype=np.float64)[None, :] - start_x
+    to_y = np.asarray(cy, dtype=np.float64)[None, :] - start_y
+
+    # Closest point on each segment, clamped to the segment; a zero-length
+    # segment degenerates to its start point
+    l2 = vx * vx + vy * vy
+    dot = to_x * vx + to_y * vy
+    t = np.clip(np.divide(dot, l2, out=np.zeros_like(dot), where=l2 > 0), 0, 1)
+    dx = to_x - t * vx
+    dy = to_y - t * vy
+    r2 = np.asarray(radius, dtype=np.float64) ** 2 * hit_scale
+    hits = (dx * dx + dy * dy) <= r2[None, :]
+
+    touched = np.flatnonzero(hits.any(axis=0))
+    if len(touched) == 0:
+        return empty, empty
+    segments = hits[:, touched].argmax(axis=0)
+    along = t[segments, touched]
+
+    # Swipe order: by segment, then by how far along that segment
+    order = np.lexsort((along, segments))
+    return touched[order], segments[order]
@@ -1,10 +1,15 @@
 # Import Pygame for color definitions and other constants
+import os
 import pygame
 
 # Window settings
 WINDOW_WIDTH = 1280   # Width of game window in pixels
 WINDOW_HEIGHT = 720   # Height of game window in pixels
-FPS = 60             # Target frames per second for smooth gameplay
+FPS = 144            # Maximum rendered frames per second
+TICK_RATE = 60       # Fixed simulation ticks per second
+SIM_DT = 1 / TICK_RATE  # Length of one simulation tick in seconds
+MAX_FRAME_TIME = 0.25   # Longest frame delta fed to the simulation, in seconds
+MAX_SEED = 2**63 - 1    # Largest gameplay seed (stored as a signed 64-bit int in snapshots and replays)
 
 # Basic color definitions (RGB format)
 BLACK = (0, 0, 0)
@@ -30,9 +35,15 @@ GRAVITY = 0.35           # Gravity strength for falling objects
 INITIAL_VELOCITY = -18   # Starting upward velocity for objects
 SPAWN_INTERVAL = 1.2     # Time between object spawns in seconds
 COMBO_TIME = 0.4         # Time window for combo chains in seconds
+SLICE_HIT_SCALE = 1.5    # Multiplier on radius squared for slice hit boxes
+SPATIAL_CELL_SIZE = 64   # Grid cell size in pixels for slice hit testing
+SWIPE_MIN_STEP = 3       # Swipe samples closer than this many pixels are dropped
+SWIPE_MAX_STEP = 20      # Longer swipe gaps are filled in along a curve
 
 # Difficulty progression settings
 DIFFICULTY_INCREASE_INTERVAL = 20  # Time between difficulty increases in seconds
+DIFFICULTY_STEP = 0.5            # Difficulty level gained at each increase
+BOMB_CHANCE = 0.3                # Bomb chance per spawn at difficulty level 1
 SPEED_INCREASE = 1.15            # Multiplier for speed increases
 SPAWN_RATE_INCREASE = 0.85       # Multiplier for spawn rate increases
 BOMB_CHANCE_INCREASE = 1.3       # Multiplier for bomb frequency increases
@@ -43,9 +54,60 @@ BUTTON_HEIGHT = 60    # Height of UI buttons in pixels
 BUTTON_PADDING = 20   # Space between buttons in pixels
 FONT_SIZE = 36        # Regular text size
 TITLE_FONT_SIZE = 72  # Title text size
+FONT_NAME = 'arial'   # System font used for all game text
+FONT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.jelly_ninja_fonts.json')  # Resolved font paths
+HIGH_SCORE_FILE = os.path.join(os.path.expanduser('~'), '.jelly_ninja_scores.json')  # Saved leaderboard
+LEADERBOARD_SIZE = 10 # Best games kept on the leaderboard
+HISTORY_SIZE = 100    # Recent games kept in the score history
+TEXT_CACHE_SIZE = 512 # Rendered text surfaces kept before LRU eviction
+TEXT_COLOR_STEP = 4   # Animated text colors are rounded to this step
+TEXT_SCALE_STEP = 0.01  # Animated text scales are rounded to this step
+PULSE_ALPHA_STEP = 16 # Game over tint strength is rounded to this step
 
 # Animation settings
 SLICE_TRAIL_LENGTH = 10    # Number of points to track for slice trail
 PARTICLE_COUNT = 20        # Number of particles per effect
+PARTICLE_CAPACITY = 4096   # Maximum number of live particles
+SPRITE_CACHE_SIZE = 1024   # Pre-rendered sprites kept before LRU eviction
+SPLATTER_FADE = 15         # Splatter alpha lost per tick (0 keeps splatters forever)
 SHAKE_INTENSITY = 10       # Screen shake amount in pixels
-SHAKE_DURATION = 0.3       # Screen shake duration in seconds 
\ No newline at end of file
+SHAKE_DURATION = 0.3       # Screen shake duration in seconds
+BACKGROUND_FPS = 20        # Distinct animated background frames drawn per second
+RENDERERS = ('auto', 'texture', 'software')  # Render backends that can be chosen at launch
+
+# Quality settings
+FRAME_BUDGET = 1000 / TICK_RATE  # Frame time to stay under, in milliseconds
+QUALITY_WINDOW = 60            # Frames measured before each quality decision
+QUALITY_DEGRADE_RATIO = 1.0    # Step down when the window's p90 exceeds budget * this
+QUALITY_RESTORE_RATIO = 0.6    # Step up when the p90 stays under budget * this...
+QUALITY_RESTORE_WINDOWS = 5    # ...for this many windows in a row
+QUALITY_LEVELS = ('low', 'medium', 'high')  # Worst to best
+QUALITY_PRESETS = {
+    # particle_count: particles per slice burst (bombs emit twice as many)
+    # background_spacing: distance between gameplay background circles in pixels
+    # trail_length: points kept in the slice trail
+    # splatter_fade: splatter alpha lost per tick, or None for no splatters
+    'low': {'particle_count': 8, 'background_spacing': 200, 'trail_length': 5, 'splatter_fade': None},
+    'medium': {'particle_count': 14, 'background_spacing': 140, 'trail_length': 8, 'splatter_fade': 30},
+    'high': {'particle_count': PARTICLE_COUNT, 'background_spacing': 100,
+             'trail_length': SLICE_TRAIL_LENGTH, 'splatter_fade': SPLATTER_FADE},
+}
+
+# Profiling settings
+PROFILE_FRAMES = 600          # Recent frames kept by the frame profiler
+PROFILE_OVERLAY_INTERVAL = 15 # Frames between profiler overlay refreshes
+PROFILE_FONT_SIZE = 16        # Profiler overlay text size
+PROFILER_KEY = pygame.K_F3    # Key that toggles the profiler overlay 
+
+# Input latency settings
+LATENCY_BUCKET_MS = 2         # Width of an input latency histogram bucket
+LATENCY_BUCKETS = 100         # Buckets per histogram; the last one is open-ended
+LATENCY_PERCENTILES = (50, 90, 99)  # Percentiles reported for input latency
+LOOP_ORDERS = ('standard', 'late-latch')  # 'late-latch' drains input again just before rendering
+
+# Rewind settings
+REWIND_INTERVAL = 6           # Ticks between snapshots kept for rewinding
+REWIND_SNAPSHOTS = 50         # Snapshots kept (REWIND_INTERVAL * this ticks of history)
+REWIND_TICKS = TICK_RATE * 2  # How far one press of the rewind key goes back
+REWIND_KEY = pygame.K_F5      # Key that rewinds the game
+CRASH_DUMP_FILE = os.path.join(os.path.expanduser('~'), '.jelly_ninja_crash.bin')  # Recent snapshots written after a crash
\ No newline at end of file
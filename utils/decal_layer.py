@@ -0,0 +1,123 @@
+# Import required modules
+import pygame
+from utils.constants import *
+from utils.render_backend import mark_changed
+
+
+class DecalLayer:
+    """
+    Persistent transparent layer for background splatters.
+    Each splatter is stamped into the layer once, and the whole layer
+    fades with a single alpha subtraction per frame, so drawing
+    splatters costs one blit no matter how many there are.
+
+    The simulation only queues clears, stamps and fades; they are taken
+    with take() and applied to the surface by whoever renders, so the
+    simulation and rendering can run on different threads.
+    """
+
+    def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT), fade=SPLATTER_FADE):
+        """
+        Initialize an empty decal layer
+
+        Args:
+            size (tuple): (width, height) of the area decals can cover
+            fade (int): Alpha removed per simulation tick; 0 keeps decals forever
+        """
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.bounds = self.surface.get_rect()
+        self.fade_step = fade
+        self.ops = []          # Queued operations: None (clear), (sprite, pos) or a fade amount
+        self.faded = 0         # Alpha queued for removal since the last stamp
+        self.rect = None       # Area holding visible decals, or None if empty
+
+    def clear(self):
+        """Remove every decal"""
+        self.ops = [None]  # Nothing queued before a clear matters
+        self.faded = 0
+
+    def stamp(self, sprite, pos):
+        """
+        Queue a decal to be drawn into the layer
+
+        Args:
+            sprite (tuple): (surface, anchor) as returned by SpriteCache
+            pos (tuple): (x, y) position of the decal's anchor
+        """
+        self.ops.append((sprite, pos))
+        self.faded = 0
+
+    def fade(self, ticks=1):
+        """
+        Queue fading for a number of simulation ticks
+
+        Args:
+            ticks (int): Number of ticks that passed
+        """
+        amount = self.fade_step * ticks
+        if amount <= 0:
+            return
+        self.faded += amount
+        ops = self.ops
+        if self.faded >= 255:
+            # Every decal is fully transparent by now
+            if ops != [None]:
+                self.clear()
+            self.faded = 255
+        elif ops and isinstance(ops[-1], int):
+            ops[-1] += amount
+        else:
+            ops.append(amount)
+
+    def take(self):
+        """
+        Take the queued operations, to be passed to apply()
+
+        Returns:
+            list: Operations queued since the last take()
+        """
+        ops = self.ops
+        self.ops = []
+        return ops
+
+    def apply(self, ops):
+        """
+        Draw queued operations into the layer, in order
+
+        Args:
+            ops (list): Operations returned by take()
+        """
+        for op in ops:
+            if op is None:
+                if self.rect is not None:
+                    self.surface.fill((0, 0, 0, 0), self.rect)
+                    mark_changed(self.surface, self.rect)
+                self.rect = None
+            elif isinstance(op, int):
+                # Subtract the fading from the layer's alpha in one pass
+                if self.rect is not None:
+                    self.surface.fill((0, 0, 0, op), self.rect, special_flags=pygame.BLEND_RGBA_SUB)
+                    mark_changed(self.surface, self.rect)
+            else:
+                (surf, anchor), pos = op
+                rect = self.surface.blit(surf, (pos[0] - anchor[0], pos[1] - anchor[1])).clip(self.bounds)
+                if rect:
+                    mark_changed(self.surface, rect)
+                    self.rect = rect if self.rect is None else self.rect.union(rect)
+
+    def draw(self, screen, offset=(0, 0)):
+        """
+        Blit the visible part of the layer
+
+        Args:
+            screen: Surface to draw on
+            offset (tuple): (x, y) offset to draw the layer at
+
+        Returns:
+            pygame.Rect: Screen area the layer was blitted to, or None
+        """
+        if self.rect is None:
+            return None
+        return screen.blit(self.surface, (self.rect.x + offset[0], self.rect.y + offset[1]), self.rect)
@@ -0,0 +1,226 @@
+# Import required modules
+import numpy as np
+from utils.constants import *
+
+
+class EntityStore:
+    """
+    Structure-of-arrays storage for jellies or bombs.
+    Every attribute lives in its own NumPy array so that physics, wall
+    bounces and culling run as a handful of vectorized passes instead of
+    one Python method call per object.
+    """
+
+    # Names of the per-entity arrays, in the order _arrays() returns them
+    FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vel_x', 'vel_y', 'radius',
+              'squish', 'squish_vel', 'color', 'flash_time', 'alive')
+
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty store
+
+        Args:
+            capacity (int): Number of entities to preallocate room for
+        """
+        self.count = 0
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_x = np.zeros(capacity, dtype=np.float32)  # Position before the last tick
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vel_x = np.zeros(capacity, dtype=np.float32)
+        self.vel_y = np.zeros(capacity, dtype=np.float32)
+        self.radius = np.zeros(capacity, dtype=np.float32)
+        self.squish = np.ones(capacity, dtype=np.float32)
+        self.squish_vel = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int16)  # Index into JELLY_COLORS
+        self.flash_time = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def snapshot(self):
+        """
+        Copy the live entities into a new, compact store
+
+        Returns:
+            EntityStore: Independent copy that later ticks do not change
+        """
+        live = self.live_indices()
+        copy = EntityStore(0)
+        for name, array in zip(self.FIELDS, self._arrays()):
+            setattr(copy, name, array[live])
+        copy.count = copy.capacity = len(live)
+        return copy
+
+    def save(self, writer):
+        """
+        Append the live part of every array to a binary snapshot
+
+        Args:
+            writer (SnapshotWriter): Snapshot being written
+        """
+        n = self.count
+        writer.table(self.FIELDS, [array[:n] for array in self._arrays()])
+
+    def restore(self, reader):
+        """
+        Replace the contents with entities read from a binary snapshot
+
+        Args:
+            reader (SnapshotReader): Snapshot being read
+        """
+        table = reader.table(self.FIELDS, [array.dtype for array in self._arrays()])
+        n = len(table)
+        self.count = 0
+        while self.capacity < n:
+            self._grow()
+        for name, array in zip(self.FIELDS, self._arrays()):
+            array[:n] = table[name]
+        self.count = n
+
+    def _arrays(self):
+        """Return every per-entity array, in a fixed order"""
+        return (self.x, self.y, self.prev_x, self.prev_y, self.vel_x,
+                self.vel_y, self.radius, self.squish, self.squish_vel,
+                self.color, self.flash_time, self.alive)
+
+    def _grow(self):
+        """Double the capacity of every array, keeping live entries"""
+        new_capacity = self.capacity * 2
+        for name, array in zip(self.FIELDS, self._arrays()):
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            setattr(self, name, grown)
+        self.capacity = new_capacity
+
+    def spawn(self, x, y, vel_x, vel_y, radius, color=0, squish=1.0):
+        """
+        Add a new entity to the end of the store
+
+        Args:
+            x, y (float): Starting position
+            vel_x, vel_y (float): Starting velocity
+            radius (float): Collision and draw radius
+            color (int): Index into JELLY_COLORS
+            squish (float): Starting squish factor (1.0 is round)
+
+        Returns:
+            int: Index of the new entity
+        """
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_x[i] = x
+        self.prev_y[i] = y
+        self.vel_x[i] = vel_x
+        self.vel_y[i] = vel_y
+        self.radius[i] = radius
+        self.squish[i] = squish
+        self.squish_vel[i] = 0
+        self.color[i] = color
+        self.flash_time[i] = 0
+        self.alive[i] = True
+        self.count += 1
+        return i
+
+    def kill(self, i):
+        """
+        Mark an entity as dead. It stays in place until the next compact().
+
+        Args:
+            i (int): Index of the entity
+
+        Returns:
+            bool: True if the entity was alive before this call
+        """
+        if i < self.count and self.alive[i]:
+            self.alive[i] = False
+            return True
+        return False
+
+    def clear(self):
+        """Remove every entity"""
+        self.count = 0
+
+    def update(self):
+        """Advance physics one tick and drop dead or out-of-bounds entities"""
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        vel_x = self.vel_x[:n]
+        vel_y = self.vel_y[:n]
+        radius = self.radius[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        # Update position
+        x += vel_x
+        y += vel_y
+        vel_y += GRAVITY
+
+        # Bounce off walls
+        left = x < radius
+        right = x > WINDOW_WIDTH - radius
+        np.copyto(x, radius, where=left)
+        np.copyto(x, WINDOW_WIDTH - radius, where=right)
+        vel_x[left | right] *= -0.8
+
+        # Update squish animation
+        squish = self.squish[:n]
+        squish_vel = self.squish_vel[:n]
+        squish += squish_vel
+        squish_vel += (1 - squish) * 0.2  # Spring force
+        squish_vel *= 0.8  # Damping
+
+        self.flash_time[:n] += 1
+
+        # Remove if out of bounds
+        self.alive[:n] &= (y <= WINDOW_HEIGHT + 100) & (y >= -100)
+        self.compact()
+
+    def compact(self):
+        """Pack live entities to the front of the arrays in one pass"""
+        n = self.count
+        alive = self.alive[:n]
+        live = int(np.count_nonzero(alive))
+        if live == n:
+            return
+        keep = alive.copy()
+        for array in self._arrays():
+            array[:live] = array[:n][keep]
+        self.count = live
+
+    def positions(self, indices, interpolation=1.0):
+        """
+        Get render positions blended between the last two ticks
+
+        Args:
+            indices (numpy.ndarray): Entities to get positions for
+            interpolation (float): 0 gives the previous tick, 1 the latest
+
+        Returns:
+            tuple: (x, y) arrays of positions
+        """
+        x = self.x[indices]
+        y = self.y[indices]
+        if interpolation >= 1.0:
+            return x, y
+        prev_x = self.prev_x[indices]
+        prev_y = self.prev_y[indices]
+        return (prev_x + (x - prev_x) * interpolation,
+                prev_y + (y - prev_y) * interpolation)
+
+    def live_indices(self):
+        """
+        Get the indices of entities that have not been killed
+
+        Returns:
+            numpy.ndarray: Indices of live entities, in store order
+        """
+        return np.flatnonzero(self.alive[:self.count])
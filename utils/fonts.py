@@ -0,0 +1,113 @@
+# Import required modules
+import os
+import json
+import pygame
+from utils.constants import *
+
+
+class FontRegistry:
+    """
+    Process-wide registry of loaded fonts.
+    Each system font name is resolved to a file once and every
+    (name, size) pair is loaded once, however many states ask for it.
+    Resolved paths are saved to FONT_CACHE_FILE, so later runs skip the
+    system font scan that the first lookup would otherwise trigger.
+    """
+
+    def __init__(self, cache_file=FONT_CACHE_FILE):
+        """
+        Initialize an empty registry
+
+        Args:
+            cache_file (str): JSON file holding resolved font paths, or None
+                to keep them in memory only
+        """
+        self.cache_file = cache_file
+        self.paths = None  # Font name -> file path ('' for pygame's default font, this run only)
+        self.fonts = {}    # (name, size) -> pygame.font.Font
+
+    def _load_paths(self):
+        """Read the resolved font paths saved by an earlier run"""
+        self.paths = {}
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file) as f:
+                paths = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(paths, dict):
+            # Drop fonts that have been uninstalled or moved since, and failed
+            # lookups, so fonts installed later are found
+            self.paths = {name: path for name, path in paths.items()
+                          if isinstance(path, str) and path and os.path.isfile(path)}
+
+    def _save_paths(self):
+        """Write the found font paths, replacing the old file atomically"""
+        if not self.cache_file:
+            return
+        temp = self.cache_file + '.tmp'
+        try:
+            with open(temp, 'w') as f:
+                json.dump({name: path for name, path in self.paths.items() if path}, f, indent=2)
+            os.replace(temp, self.cache_file)
+        except OSError:
+            pass  # The cache only saves time; the game works without it
+
+    def resolve(self, name):
+        """
+        Find the file for a system font name
+
+        Args:
+            name (str): Comma-separated system font names, as for SysFont
+
+        Returns:
+            str: Path of the font file, or '' if only pygame's default font fits
+        """
+        if self.paths is None:
+            self._load_paths()
+        path = self.paths.get(name)
+        if path is None:
+            path = pygame.font.match_font(name) or ''
+            self.paths[name] = path
+            if path:
+                self._save_paths()
+        return path
+
+    def get(self, name, size):
+        """
+        Get a shared font, loading it on first use
+
+        Args:
+            name (str): Comma-separated system font names, as for SysFont
+            size (int): Font size
+
+        Returns:
+            pygame.font.Font: Font object shared by every caller
+        """
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(self.resolve(name) or None, size)
+            self.fonts[key] = font
+        return font
+
+
+# Registry shared by the whole process
+registry = FontRegistry()
+
+
+def get_font(name, size):
+    """
+    Get a font from the shared registry
+
+    Args:
+        name (str): Comma-separated system font names, as for SysFont
+        size (int): Font size
+
+    Returns:
+        pygame.font.Font: Font object shared by every caller
+    """
+    return registry.get(name, size)
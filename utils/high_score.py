@@ -1,23 +1,82 @@
+# Import required modules
+import os
+import json
+import time
+import queue
+import threading
+from utils.constants import *
+
+
 class HighScore:
     """
     Manages the game's high score system.
-    Keeps track of the highest score achieved in the current session.
+    Keeps a top-N leaderboard and a history of recent games on disk, so
+    scores survive restarts. Every read is served from memory; writes are
+    handed to a background thread that replaces the file atomically, so
+    ending a game never waits on the disk.
     """
     
-    def __init__(self):
-        """Initialize the high score system with a starting score of 0"""
-        self.high_score = 0  # Simply store in memory, no file persistence
+    def __init__(self, path=HIGH_SCORE_FILE, size=LEADERBOARD_SIZE, history_size=HISTORY_SIZE):
+        """
+        Initialize the high score system, loading saved scores if there are any
+        
+        Args:
+            path (str): JSON file to keep scores in, or None to keep them in memory only
+            size (int): Number of entries on the leaderboard
+            history_size (int): Number of recent games kept in the history
+        """
+        self.path = path
+        self.size = size
+        self.history_size = history_size
+        self.session = int(time.time())  # Identifies the games played in this run
+        self.leaderboard = []  # Best games first: {'score', 'time', 'session'}
+        self.history = []      # Most recent game last, same fields
+        self.session_scores = []  # Scores of every game played in this run
+        self.high_score = 0
+        self.saves = queue.Queue()
+        self.writer = None
+        self.load()
+        
+    def load(self):
+        """Read saved scores from disk, ignoring a missing or damaged file"""
+        if not self.path:
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            leaderboard = [entry for entry in data.get('leaderboard', []) if isinstance(entry.get('score'), int)]
+            history = [entry for entry in data.get('history', []) if isinstance(entry.get('score'), int)]
+        except (OSError, ValueError, AttributeError):
+            return
+        self.leaderboard = sorted(leaderboard, key=lambda entry: -entry['score'])[:self.size]
+        self.history = history[-self.history_size:]
+        if self.leaderboard:
+            self.high_score = self.leaderboard[0]['score']
         
     def update_high_score(self, score):
         """
-        Check if the current score is a new high score and update if necessary
+        Record a finished game and check whether it set a new high score
         
         Args:
-            score (int): The score to check against the high score
+            score (int): The score of the game
             
         Returns:
             bool: True if a new high score was set, False otherwise
         """
+        entry = {'score': int(score), 'time': int(time.time()), 'session': self.session}
+        self.session_scores.append(entry['score'])
+        self.history.append(entry)
+        del self.history[:-self.history_size]
+        
+        # Insert after equal scores, so earlier games keep their place
+        rank = len(self.leaderboard)
+        while rank > 0 and self.leaderboard[rank - 1]['score'] < entry['score']:
+            rank -= 1
+        if rank < self.size:
+            self.leaderboard.insert(rank, entry)
+            del self.leaderboard[self.size:]
+        self.save()
+        
         if score > self.high_score:
             self.high_score = score
             return True
@@ -30,4 +89,69 @@ class HighScore:
         Returns:
             int: The current high score
         """
-        return self.high_score 
\ No newline at end of file
+        return self.high_score
+        
+    def get_leaderboard(self):
+        """
+        Retrieve the best games
+        
+        Returns:
+            list: Up to `size` entries ({'score', 'time', 'session'}), best first
+        """
+        return list(self.leaderboard)
+        
+    def get_session_scores(self):
+        """
+        Retrieve the scores of the games played since the game started
+        
+        Returns:
+            list: Scores in the order the games were played
+        """
+        return list(self.session_scores)
+        
+    def save(self):
+        """Queue the current scores to be written by the background writer"""
+        if not self.path:
+            return
+        if self.writer is None:
+            self.writer = threading.Thread(target=self._write_loop, name='high-score-writer', daemon=True)
+            self.writer.start()
+        # Hand over a snapshot so the writer never sees lists being changed
+        self.saves.put({'leaderboard': list(self.leaderboard), 'history': list(self.history)})
+        
+    def flush(self):
+        """Wait until every queued write has reached the disk"""
+        if self.writer is not None:
+            self.saves.join()
+            
+    def _write_loop(self):
+        """Background thread: write queued snapshots, skipping ones already superseded"""
+        while True:
+            data = self.saves.get()
+            done = 1
+            while True:
+                try:
+                    data = self.saves.get_nowait()
+                    done += 1
+                except queue.Empty:
+                    break
+            self._write(data)
+            for _ in range(done):
+                self.saves.task_done()
+                
+    def _write(self, data):
+        """
+        Replace the scores file atomically
+        
+        Args:
+            data (dict): Snapshot to write
+        """
+        temp = self.path + '.tmp'
+        try:
+            with open(temp, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, self.path)
+        except OSError:
+            pass  # Keep playing; the scores are still in memory
@@ -0,0 +1,132 @@
+# Import required modules
+import time
+import pygame
+import numpy as np
+from utils.constants import *
+
+# Input events whose effect on screen is timed, by the name they are reported under
+LATENCY_KINDS = {pygame.MOUSEBUTTONDOWN: 'down', pygame.MOUSEMOTION: 'motion'}
+
+
+class LatencyTracker:
+    """
+    Input-to-photon latency histograms for one session.
+    pygame events carry no timestamps, so an event's arrival is estimated
+    as the midpoint between the queue drain that returned it and the one
+    before (it arrived somewhere in between). Its latency runs from there
+    to the end of the first present after it was handled in which the
+    simulation also ticked, so both its trail segment and any slice it
+    caused are on screen.
+    """
+
+    def __init__(self, bucket_ms=LATENCY_BUCKET_MS, buckets=LATENCY_BUCKETS, log_path=None):
+        """
+        Initialize empty histograms
+
+        Args:
+            bucket_ms (float): Width of a histogram bucket in milliseconds
+            buckets (int): Number of buckets; the last one also holds everything slower
+            log_path (str): Append one "kind,milliseconds" line per event to this file
+        """
+        self.bucket_ms = bucket_ms
+        self.counts = {kind: np.zeros(buckets, dtype=np.int64) for kind in LATENCY_KINDS.values()}
+        self.totals = dict.fromkeys(self.counts, 0.0)  # Sum of latencies, for the mean
+        self.worst = dict.fromkeys(self.counts, 0.0)
+        self.pending = []  # (kind, estimated arrival) of events not on screen yet
+        self.waiting = []  # Like pending, but handled after this frame's ticks
+        self.last_drain = None
+        self.log = open(log_path, 'a') if log_path else None
+
+    def drained(self, events, now=None, after_ticks=False):
+        """
+        Note events just taken from the queue
+
+        Args:
+            events (list): Events returned by pygame.event.get()
+            now (float): time.perf_counter() of the drain, or None for now
+            after_ticks (bool): The events are handled after this frame's
+                ticks (late latching), so their slices need a later tick
+        """
+        now = time.perf_counter() if now is None else now
+        arrival = now if self.last_drain is None else (self.last_drain + now) / 2
+        self.last_drain = now
+        for event in events:
+            kind = LATENCY_KINDS.get(event.type)
+            # Motion without the button held draws nothing
+            if kind == 'motion' and not event.buttons[0]:
+                continue
+            if kind is not None:
+                (self.waiting if after_ticks else self.pending).append((kind, arrival))
+
+    def presented(self, ticks, now=None):
+        """
+        Note that a frame was presented
+
+        Args:
+            ticks (int): Simulation ticks run since the previous frame
+            now (float): time.perf_counter() after the present, or None for now
+        """
+        if self.pending and ticks > 0:
+            self._record(time.perf_counter() if now is None else now)
+        # Events handled after this frame's ticks count from the next frame that ticks
+        if self.waiting:
+            self.pending += self.waiting
+            self.waiting.clear()
+
+    def _record(self, now):
+        """Add every pending event to the histograms, shown at `now`"""
+        last = len(self.counts['down']) - 1
+        for kind, arrival in self.pending:
+            ms = (now - arrival) * 1000
+            self.counts[kind][min(int(ms // self.bucket_ms), last)] += 1
+            self.totals[kind] += ms
+            self.worst[kind] = max(self.worst[kind], ms)
+            if self.log is not None:
+                self.log.write(f"{kind},{ms:.3f}\n")
+        self.pending.clear()
+
+    def histogram(self, kind=None):
+        """
+        Get a latency histogram
+
+        Args:
+            kind (str): 'down' or 'motion', or None for both together
+
+        Returns:
+            tuple: (edges, counts) where counts[i] events took between
+                edges[i] and edges[i + 1] milliseconds (the last bucket is open-ended)
+        """
+        counts = sum(self.counts.values()) if kind is None else self.counts[kind]
+        edges = np.arange(len(counts) + 1) * self.bucket_ms
+        return edges, counts.copy()
+
+    def stats(self, kind=None):
+        """
+        Summarize the recorded latencies
+
+        Args:
+            kind (str): 'down' or 'motion', or None for both together
+
+        Returns:
+            dict: 'events' count plus 'mean', 'max' and the upper bucket edge
+                for every one of PERCENTILES as 'p50' etc., in milliseconds
+        """
+        kinds = list(self.counts) if kind is None else [kind]
+        edges, counts = self.histogram(kind)
+        total = int(counts.sum())
+        result = {'events': total}
+        if total == 0:
+            return result
+        cumulative = np.cumsum(counts)
+        for p in LATENCY_PERCENTILES:
+            bucket = int(np.searchsorted(cumulative, total * p / 100))
+            result[f'p{p}'] = float(edges[bucket + 1])
+        result['mean'] = sum(self.totals[k] for k in kinds) / total
+        result['max'] = max(self.worst[k] for k in kinds)
+        return result
+
+    def close(self):
+        """Close the log file, if any"""
+        if self.log is not None:
+            self.log.close()
+            self.log = None
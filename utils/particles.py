@@ -0,0 +1,207 @@
+# Import required modules
+import numpy as np
+import pygame
+from utils.constants import *
+from utils.state_snapshot import save_generator, restore_generator
+from utils.sprite_cache import SpriteCache, ALPHA_LEVELS, level_alpha
+
+# Per-particle arrays that make up the simulation state
+SNAPSHOT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vel_x', 'vel_y', 'lifetime', 'max_lifetime', 'color')
+
+
+class ParticleSystem:
+    """
+    Fixed-capacity particle engine.
+    Particles live in preallocated NumPy arrays, are emitted a whole burst
+    at a time, integrated and aged in one vectorized step, and drawn from a
+    small set of cached dot sprites with a single Surface.blits call.
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, rng=None, sprites=None):
+        """
+        Initialize an empty particle system
+
+        Args:
+            capacity (int): Maximum number of live particles
+            rng: numpy Generator used for burst randomness
+            sprites (SpriteCache): Cache the dot sprites come from
+        """
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_x = np.zeros(capacity, dtype=np.float32)  # Position before the last tick
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vel_x = np.zeros(capacity, dtype=np.float32)
+        self.vel_y = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int16)
+        self.max_lifetime = np.ones(capacity, dtype=np.int16)
+        self.color = np.zeros(capacity, dtype=np.uint8)  # Index into self.palette
+        self.palette = []  # RGB colors seen so far
+        self.palette_index = {}  # RGB color -> palette index
+        self.sprites = sprites if sprites is not None else SpriteCache()
+
+    def __len__(self):
+        return self.count
+
+    def snapshot(self):
+        """
+        Copy the live particles into a new system that can only be drawn
+
+        Returns:
+            ParticleSystem: Independent copy that later ticks do not change
+        """
+        n = self.count
+        copy = ParticleSystem(0, rng=self.rng, sprites=self.sprites)
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'lifetime', 'max_lifetime', 'color'):
+            setattr(copy, name, getattr(self, name)[:n].copy())
+        copy.count = copy.capacity = n
+        copy.palette = list(self.palette)
+        return copy
+
+    def save(self, writer):
+        """
+        Append the live particles, palette and RNG state to a binary snapshot
+
+        Args:
+            writer (SnapshotWriter): Snapshot being written
+        """
+        n = self.count
+        writer.table(SNAPSHOT_FIELDS, [getattr(self, name)[:n] for name in SNAPSHOT_FIELDS])
+        writer.array(np.array(self.palette, dtype=np.uint8).reshape(-1, 3))
+        save_generator(writer, self.rng)
+
+    def restore(self, reader):
+        """
+        Replace the particles with ones read from a binary snapshot
+
+        Args:
+            reader (SnapshotReader): Snapshot being read
+
+        Raises:
+            ValueError: If the snapshot holds more particles than fit
+        """
+        table = reader.table(SNAPSHOT_FIELDS, [getattr(self, name).dtype for name in SNAPSHOT_FIELDS])
+        n = len(table)
+        if n > self.capacity:
+            raise ValueError(f"snapshot has {n} particles; capacity is {self.capacity}")
+        for name in SNAPSHOT_FIELDS:
+            getattr(self, name)[:n] = table[name]
+        self.count = n
+        self.palette = [tuple(color) for color in reader.array(np.uint8, 3).tolist()]
+        self.palette_index = {color: i for i, color in enumerate(self.palette)}
+        restore_generator(reader, self.rng)
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+
+    def emit(self, x, y, color, count, speed_range, lifetime_range):
+        """
+        Emit a burst of particles flying out in random directions
+
+        Args:
+            x, y (float): Burst origin
+            color (tuple): RGB color of the burst
+            count (int): Number of particles to emit
+            speed_range (tuple): (min, max) launch speed
+            lifetime_range (tuple): (min, max) lifetime in ticks, inclusive
+
+        Returns:
+            int: Number of particles actually emitted (limited by capacity)
+        """
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        start = self.count
+        end = start + count
+
+        angle = self.rng.uniform(0, np.pi * 2, count)
+        speed = self.rng.uniform(speed_range[0], speed_range[1], count)
+        lifetime = self.rng.integers(lifetime_range[0], lifetime_range[1] + 1, count)
+
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.prev_x[start:end] = x
+        self.prev_y[start:end] = y
+        self.vel_x[start:end] = np.cos(angle) * speed
+        self.vel_y[start:end] = np.sin(angle) * speed
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+        return count
+
+    def _color_index(self, color):
+        """Get the palette index for a color, adding it if needed"""
+        color = tuple(color[:3])
+        index = self.palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.palette_index[color] = index
+        return index
+
+    def update(self):
+        """Move and age every particle, then drop the expired ones"""
+        n = self.count
+        if n == 0:
+            return
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vel_x[:n]
+        self.y[:n] += self.vel_y[:n]
+        self.vel_y[:n] += GRAVITY * 0.5
+        self.lifetime[:n] -= 1
+
+        alive = self.lifetime[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for array in (self.x, self.y, self.prev_x, self.prev_y, self.vel_x, self.vel_y,
+                          self.lifetime, self.max_lifetime, self.color):
+                array[:live] = array[:n][alive]
+            self.count = live
+
+    def draw(self, screen, offset=(0, 0), interpolation=1.0):
+        """
+        Draw every particle, fading out with age
+
+        Args:
+            screen: Surface to draw on
+            offset (tuple): (x, y) offset added to every particle (screen shake)
+            interpolation (float): Blend between the previous (0) and latest (1) tick
+
+        Returns:
+            pygame.Rect: Area the particles cover, or None if there are none
+        """
+        n = self.count
+        if n == 0:
+            return None
+        levels = (self.lifetime[:n].astype(np.int32) * (ALPHA_LEVELS - 1)
+                  // self.max_lifetime[:n])
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * interpolation
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * interpolation
+        xs = (x + (offset[0] - 2)).astype(np.int32)
+        ys = (y + (offset[1] - 2)).astype(np.int32)
+        left, top = int(xs.min()), int(ys.min())
+        rect = pygame.Rect(left, top, int(xs.max()) - left + 4, int(ys.max()) - top + 4)
+        dot = self.sprites.dot
+        palette = self.palette
+        draw_modulated = getattr(screen, 'draw_modulated', None)
+        if draw_modulated is not None:
+            # Texture canvas: one white dot texture, faded and tinted per draw
+            white = dot(WHITE, ALPHA_LEVELS - 1)[0]
+            for color, level, x, y in zip(self.color[:n].tolist(), levels.tolist(),
+                                          xs.tolist(), ys.tolist()):
+                if level > 0:
+                    draw_modulated(white, (x, y), level_alpha(level), palette[color])
+            return rect
+        screen.blits(
+            [(dot(palette[color], level)[0], (x, y))
+             for color, level, x, y in zip(self.color[:n].tolist(), levels.tolist(),
+                                           xs.tolist(), ys.tolist())
+             if level > 0],
+            doreturn=False
+        )
+        return rect
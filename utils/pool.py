@@ -0,0 +1,64 @@
+class Pool:
+    """
+    Free list of reusable objects of one class.
+    Released objects are kept and handed out again by acquire(), so
+    short-lived effects stop allocating new instances once the pool has
+    warmed up. Pooled classes should define __slots__ and a reset()
+    method taking the same arguments as acquire().
+    """
+
+    def __init__(self, cls):
+        """
+        Initialize an empty pool
+
+        Args:
+            cls: Class of the pooled objects
+        """
+        self.cls = cls
+        self.free = []
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args):
+        """
+        Get an object, reusing a released one when there is one
+
+        Args:
+            *args: Passed to the object's reset() method
+
+        Returns:
+            object: Freshly reset object
+        """
+        obj = self.free.pop() if self.free else self.cls.__new__(self.cls)
+        obj.reset(*args)
+        return obj
+
+    def release(self, obj):
+        """
+        Return an object to the pool. It must not be used afterwards.
+
+        Args:
+            obj: Object previously returned by acquire()
+        """
+        self.free.append(obj)
+
+    def release_dead(self, objects, alive):
+        """
+        Release every object that fails a test, compacting the list in place
+
+        Survivors keep their order. This replaces list.remove() inside a
+        loop over a copy with one pass and no new list.
+
+        Args:
+            objects (list): Objects to filter, modified in place
+            alive: Function returning True for objects to keep
+        """
+        kept = 0
+        for obj in objects:
+            if alive(obj):
+                objects[kept] = obj
+                kept += 1
+            else:
+                self.free.append(obj)
+        del objects[kept:]
@@ -0,0 +1,193 @@
+# Import required modules
+import csv
+import json
+import time
+import pygame
+import numpy as np
+from utils.constants import *
+from utils.fonts import get_font
+
+# Phases of a frame, in the order the main loop runs them
+PHASES = ('events', 'update', 'render', 'flip')
+# Per-frame object counts reported by states
+COUNTS = ('jellies', 'bombs', 'particles')
+# Percentiles reported for every phase
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Per-frame phase timer for the main loop.
+    Keeps the last PROFILE_FRAMES frames in a ring buffer (phase times,
+    active state and object counts), summarizes them as p50/p95/p99/max,
+    draws an optional on-screen overlay and exports to CSV or JSON.
+    """
+
+    def __init__(self, capacity=PROFILE_FRAMES):
+        """
+        Initialize an empty profiler
+
+        Args:
+            capacity (int): Number of recent frames to keep
+        """
+        self.capacity = capacity
+        self.times = np.zeros((capacity, len(PHASES)))  # Milliseconds per phase
+        self.counts = np.zeros((capacity, len(COUNTS)), dtype=np.int64)
+        self.states = [''] * capacity
+        self.frames = 0  # Total frames recorded; the ring holds the last `capacity`
+        self.frame_start = 0.0
+        self.last_lap = 0.0
+        self.current = np.zeros(len(PHASES))
+        self.visible = False
+        self.font = None
+        self.overlay_lines = []
+
+    def start_frame(self):
+        """Start timing a new frame"""
+        self.frame_start = self.last_lap = time.perf_counter()
+        self.current[:] = 0
+
+    def lap(self, phase):
+        """
+        Charge the time since the previous lap to a phase
+
+        Args:
+            phase (str): One of PHASES
+        """
+        now = time.perf_counter()
+        self.current[PHASES.index(phase)] += (now - self.last_lap) * 1000
+        self.last_lap = now
+
+    def end_frame(self, state, counts=None):
+        """
+        Store the finished frame in the ring buffer
+
+        Args:
+            state (str): Name of the state that was active
+            counts (dict): Object counts for the frame, keyed by COUNTS names
+        """
+        slot = self.frames % self.capacity
+        self.times[slot] = self.current
+        self.states[slot] = state
+        counts = counts or {}
+        self.counts[slot] = [counts.get(name, 0) for name in COUNTS]
+        self.frames += 1
+        if self.visible and self.frames % PROFILE_OVERLAY_INTERVAL == 0:
+            self.overlay_lines = self.summary_lines()
+
+    def _recent(self):
+        """Get the number of valid frames in the ring buffer"""
+        return min(self.frames, self.capacity)
+
+    def stats(self, state=None):
+        """
+        Summarize the recorded frames
+
+        Args:
+            state (str): Only include frames from this state, or None for all
+
+        Returns:
+            dict: {phase: {'p50', 'p95', 'p99', 'max', 'mean'}} in milliseconds,
+                plus 'total' for the whole frame and 'frames' for the sample size
+        """
+        n = self._recent()
+        times = self.times[:n]
+        if state is not None:
+            times = times[[s == state for s in self.states[:n]]]
+        result = {'frames': len(times)}
+        if len(times) == 0:
+            return result
+        columns = dict(zip(PHASES, times.T))
+        columns['total'] = times.sum(axis=1)
+        for name, column in columns.items():
+            summary = {f'p{p}': float(v) for p, v in zip(PERCENTILES, np.percentile(column, PERCENTILES))}
+            summary['max'] = float(column.max())
+            summary['mean'] = float(column.mean())
+            result[name] = summary
+        return result
+
+    def state_stats(self):
+        """
+        Summarize the recorded frames separately for every state
+
+        Returns:
+            dict: {state name: stats(state)}
+        """
+        return {state: self.stats(state) for state in sorted(set(self.states[:self._recent()]))}
+
+    def summary_lines(self):
+        """Build the text lines shown on the overlay"""
+        stats = self.stats()
+        if stats['frames'] == 0:
+            return []
+        lines = [f"{'phase':<7}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>7}"]
+        for name in PHASES + ('total',):
+            s = stats[name]
+            lines.append(f"{name:<7}{s['p50']:7.2f}{s['p95']:7.2f}{s['p99']:7.2f}{s['max']:7.2f}")
+        last = (self.frames - 1) % self.capacity
+        lines.append(' '.join(f"{name} {count}" for name, count in zip(COUNTS, self.counts[last])))
+        return lines
+
+    def toggle(self):
+        """Show or hide the on-screen overlay"""
+        self.visible = not self.visible
+        if self.visible:
+            self.overlay_lines = self.summary_lines()
+
+    def draw(self, screen):
+        """
+        Draw the timing overlay in the top right corner if it is visible
+
+        Args:
+            screen: Surface to draw on
+
+        Returns:
+            pygame.Rect: Area covered by the overlay, or None if nothing was drawn
+        """
+        if not self.visible or not self.overlay_lines:
+            return None
+        if self.font is None:
+            self.font = get_font('couriernew,monospace', PROFILE_FONT_SIZE)
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in self.overlay_lines) + 20
+        height = line_height * len(self.overlay_lines) + 20
+        panel = pygame.Rect(screen.get_width() - width - 10, 10, width, height)
+        screen.fill((0, 0, 0), panel)
+        for i, line in enumerate(self.overlay_lines):
+            text = self.font.render(line, True, (0, 255, 0))
+            screen.blit(text, (panel.x + 10, panel.y + 10 + i * line_height))
+        return panel
+
+    def export(self, path):
+        """
+        Write the recorded frames to a file
+
+        A .json path gets the overall and per-state summaries plus every
+        frame; any other path gets one CSV row per frame.
+
+        Args:
+            path (str): File to write
+        """
+        n = self._recent()
+        # Oldest frame first
+        order = [(self.frames - n + i) % self.capacity for i in range(n)]
+        if path.endswith('.json'):
+            data = {
+                'summary': self.stats(),
+                'states': self.state_stats(),
+                'frames': [
+                    dict(state=self.states[i],
+                         **dict(zip(PHASES, self.times[i].tolist())),
+                         **dict(zip(COUNTS, self.counts[i].tolist())))
+                    for i in order
+                ]
+            }
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+        else:
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(('state',) + PHASES + COUNTS)
+                for i in order:
+                    writer.writerow([self.states[i]] + self.times[i].round(4).tolist()
+                                    + self.counts[i].tolist())
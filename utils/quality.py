@@ -0,0 +1,85 @@
+# Import required modules
+import numpy as np
+from utils.constants import *
+
+
+class QualityGovernor:
+    """
+    Picks a quality preset from measured frame times.
+    Frame times are collected in windows of QUALITY_WINDOW frames. A
+    window whose 90th percentile misses the budget drops quality one
+    level at once; quality only comes back one level after several
+    windows in a row with plenty of headroom, so it does not flap between
+    levels. With adaptation off it simply holds the chosen preset.
+    """
+
+    def __init__(self, level='high', adaptive=False, budget=FRAME_BUDGET):
+        """
+        Initialize the governor
+
+        Args:
+            level (str): Starting preset, one of QUALITY_LEVELS
+            adaptive (bool): Change the level based on observed frame times
+            budget (float): Frame time to stay under, in milliseconds
+        """
+        if level not in QUALITY_PRESETS:
+            raise ValueError(f"unknown quality {level!r}; choose from {', '.join(QUALITY_LEVELS)}")
+        self.level = level
+        self.adaptive = adaptive
+        self.budget = budget
+        self.window = np.zeros(QUALITY_WINDOW)
+        self.filled = 0
+        self.good_windows = 0  # Windows in a row with enough headroom to step up
+        self.changes = 0       # Level changes so far, so callers can spot new settings
+
+    @property
+    def settings(self):
+        """Settings of the current preset (see QUALITY_PRESETS)"""
+        return QUALITY_PRESETS[self.level]
+
+    def set_level(self, level):
+        """
+        Switch to a preset
+
+        Args:
+            level (str): One of QUALITY_LEVELS
+        """
+        if level != self.level:
+            self.level = level
+            self.changes += 1
+        self.filled = 0
+        self.good_windows = 0
+
+    def observe(self, frame_ms):
+        """
+        Record the work time of one frame, adapting the level at the end of a window
+
+        Args:
+            frame_ms (float): Time spent on the frame, excluding any frame-cap sleep
+
+        Returns:
+            bool: True if the level changed
+        """
+        if not self.adaptive:
+            return False
+        self.window[self.filled] = frame_ms
+        self.filled += 1
+        if self.filled < len(self.window):
+            return False
+        self.filled = 0
+
+        p90 = float(np.percentile(self.window, 90))
+        index = QUALITY_LEVELS.index(self.level)
+        if p90 > self.budget * QUALITY_DEGRADE_RATIO:
+            self.good_windows = 0
+            if index > 0:
+                self.set_level(QUALITY_LEVELS[index - 1])
+                return True
+        elif p90 < self.budget * QUALITY_RESTORE_RATIO:
+            self.good_windows += 1
+            if self.good_windows >= QUALITY_RESTORE_WINDOWS and index < len(QUALITY_LEVELS) - 1:
+                self.set_level(QUALITY_LEVELS[index + 1])
+                return True
+        else:
+            self.good_windows = 0
+        return False
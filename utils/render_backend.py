@@ -0,0 +1,316 @@
+# Import required modules
+import weakref
+import pygame
+from utils.constants import *
+
+# SDL_RendererFlags values reported by pygame._sdl2.video.get_drivers()
+SDL_RENDERER_SOFTWARE = 0x1
+SDL_RENDERER_ACCELERATED = 0x2
+BLENDMODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+
+# Surfaces changed since their texture was last uploaded: surface -> Rect.
+# Only filled in once a TextureCanvas exists, so the software path pays nothing.
+_changed = weakref.WeakKeyDictionary()
+_tracking = False
+
+
+def mark_changed(surface, rect=None):
+    """
+    Note that part of a reusable surface was redrawn, so a texture backend
+    re-uploads that part before the surface is drawn again
+
+    Args:
+        surface: Surface that changed
+        rect (pygame.Rect): Area that changed, or None for all of it
+    """
+    if not _tracking:
+        return
+    rect = surface.get_rect() if rect is None else pygame.Rect(rect).clip(surface.get_rect())
+    previous = _changed.get(surface)
+    _changed[surface] = rect if previous is None else previous.union(rect)
+
+
+def select_backend(preference='auto', drivers=None):
+    """
+    Choose a render backend
+
+    'auto' uses an accelerated SDL renderer when one is available and
+    software blitting otherwise. 'texture' uses an SDL renderer even if only
+    the software one exists (useful for testing without a GPU).
+
+    Args:
+        preference (str): 'auto', 'texture' or 'software'
+        drivers (list): Renderer driver infos to choose from, or None to ask SDL
+
+    Returns:
+        list: Renderer driver indices to try, best first; empty for software blitting
+    """
+    if preference not in RENDERERS:
+        raise ValueError(f"unknown renderer {preference!r}; choose from {', '.join(RENDERERS)}")
+    if preference == 'software':
+        return []
+    if drivers is None:
+        try:
+            from pygame._sdl2.video import get_drivers
+            drivers = list(get_drivers())
+        except (ImportError, pygame.error):
+            return []
+    accelerated = [i for i, d in enumerate(drivers) if d.flags & SDL_RENDERER_ACCELERATED]
+    if preference == 'auto':
+        return accelerated
+    software = [i for i, d in enumerate(drivers) if d.flags & SDL_RENDERER_SOFTWARE]
+    return accelerated + software
+
+
+def create_backend(preference='auto', size=(WINDOW_WIDTH, WINDOW_HEIGHT), caption="Jelly Ninja"):
+    """
+    Open the game window with the best backend that actually starts
+
+    Args:
+        preference (str): 'auto', 'texture' or 'software'
+        size (tuple): Window size
+        caption (str): Window title
+
+    Returns:
+        TextureBackend or SoftwareBackend: The backend in use
+    """
+    for index in select_backend(preference):
+        try:
+            return TextureBackend(size, caption, index)
+        except RuntimeError:
+            # Listed but unusable here (e.g. no GL context); try the next one.
+            # pygame._sdl2 raises its own error type, but both derive from RuntimeError.
+            continue
+    return SoftwareBackend(size, caption)
+
+
+class SoftwareBackend:
+    """Default backend: every state draws on the display surface with CPU blits"""
+
+    name = 'software'
+
+    def __init__(self, size, caption):
+        """
+        Open the window
+
+        Args:
+            size (tuple): Window size
+            caption (str): Window title
+        """
+        pygame.display.set_caption(caption)
+        self.screen = pygame.display.set_mode(size)
+
+    def target(self, state):
+        """
+        Get what a state should render onto
+
+        Args:
+            state: The state about to render
+
+        Returns:
+            pygame.Surface: The display surface
+        """
+        return self.screen
+
+    def present(self, dirty, target):
+        """
+        Show the rendered frame
+
+        Args:
+            dirty (list): Rects that changed, or None to update the whole window
+            target: What the frame was rendered onto
+        """
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+
+
+class TextureBackend:
+    """
+    Backend built on pygame._sdl2.video Renderer and Texture.
+    States that support it (the gameplay screen) draw through a
+    TextureCanvas, so compositing runs on the SDL renderer. The other
+    states keep drawing in software onto an offscreen surface, and only
+    the rects they report as changed are uploaded.
+    """
+
+    name = 'texture'
+
+    def __init__(self, size, caption, index=-1):
+        """
+        Open the window and its renderer
+
+        Args:
+            size (tuple): Window size
+            caption (str): Window title
+            index (int): Renderer driver index, or -1 for SDL's choice
+
+        Raises:
+            RuntimeError: If the renderer cannot be created
+        """
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self.window = Window(caption, size=size)
+        try:
+            self.renderer = Renderer(self.window, index=index)
+        except RuntimeError:
+            self.window.destroy()
+            raise
+        self.screen = pygame.Surface(size)
+        self.screen_texture = Texture(self.renderer, size, streaming=True)
+        self.canvas = TextureCanvas(self.renderer, size)
+
+    def target(self, state):
+        """
+        Get what a state should render onto
+
+        Args:
+            state: The state about to render
+
+        Returns:
+            TextureCanvas or pygame.Surface: The canvas for states that
+                support it, otherwise the offscreen surface
+        """
+        return self.canvas if state.supports_canvas else self.screen
+
+    def present(self, dirty, target):
+        """
+        Show the rendered frame
+
+        Args:
+            dirty (list): Rects that changed, or None if the whole target changed
+            target: What the frame was rendered onto
+        """
+        if target is self.screen:
+            # Upload what changed, then draw the whole software frame
+            if dirty is None:
+                self.screen_texture.update(self.screen)
+            else:
+                for rect in dirty:
+                    rect = pygame.Rect(rect).clip(self.screen.get_rect())
+                    if rect:
+                        self.screen_texture.update(self.screen.subsurface(rect), rect)
+            self.screen_texture.draw()
+        self.renderer.present()
+
+
+class TextureCanvas:
+    """
+    Surface-like drawing target backed by an SDL Renderer.
+    Supports the subset of the Surface API the gameplay screen uses
+    (blit, blits, fill and size queries). Every surface drawn is uploaded
+    to a texture once and reused for as long as the surface lives;
+    surfaces that are redrawn in place report it with mark_changed().
+    """
+
+    def __init__(self, renderer, size):
+        """
+        Initialize the canvas
+
+        Args:
+            renderer: pygame._sdl2.video.Renderer to draw with
+            size (tuple): Canvas size
+        """
+        global _tracking
+        _tracking = True
+        self.renderer = renderer
+        self.rect = pygame.Rect((0, 0), size)
+        self.textures = weakref.WeakKeyDictionary()  # surface -> Texture
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+    def get_rect(self, **kwargs):
+        return self.rect.copy() if not kwargs else pygame.Rect(self.rect).move_to(**kwargs)
+
+    def texture(self, surface):
+        """
+        Get the texture for a surface, uploading it or its changed area as needed
+
+        Args:
+            surface: Surface to draw
+
+        Returns:
+            pygame._sdl2.video.Texture: Texture holding the surface's pixels
+        """
+        from pygame._sdl2.video import Texture
+        texture = self.textures.get(surface)
+        changed = _changed.pop(surface, None)
+        if texture is None or texture.width != surface.get_width() or texture.height != surface.get_height():
+            texture = Texture.from_surface(self.renderer, surface)
+            texture.blend_mode = BLENDMODE_BLEND
+            self.textures[surface] = texture
+        elif changed:
+            texture.update(surface.subsurface(changed), changed)
+        alpha = surface.get_alpha()
+        texture.alpha = 255 if alpha is None else alpha
+        return texture
+
+    def blit(self, surface, dest, area=None, special_flags=0):
+        """
+        Draw a surface, like Surface.blit (special_flags are not supported)
+
+        Returns:
+            pygame.Rect: Area drawn to
+        """
+        texture = self.texture(surface)
+        x, y = dest[0], dest[1]
+        if area is None:
+            rect = pygame.Rect(x, y, surface.get_width(), surface.get_height())
+            texture.draw(dstrect=rect)
+        else:
+            area = pygame.Rect(area)
+            rect = pygame.Rect(x, y, area.width, area.height)
+            texture.draw(srcrect=area, dstrect=rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        """
+        Draw many surfaces, like Surface.blits
+
+        Returns:
+            list: Areas drawn to, or None if doreturn is false
+        """
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        """
+        Fill an area with a solid color, like Surface.fill
+
+        Returns:
+            pygame.Rect: Area filled
+        """
+        color = pygame.Color(color)
+        self.renderer.draw_color = color
+        if rect is None:
+            self.renderer.clear()
+            return self.rect.copy()
+        rect = pygame.Rect(rect)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def draw_modulated(self, surface, dest, alpha=255, tint=None, scale=1.0):
+        """
+        Draw a surface with per-draw opacity, color tint and scaling, so one
+        uploaded texture can stand in for many pre-faded or pre-tinted sprites
+
+        Args:
+            surface: Surface to draw (white sprites tint to any color)
+            dest (tuple): (x, y) top left corner
+            alpha (int): Opacity (0-255)
+            tint (tuple): RGB color multiplied into the sprite, or None
+            scale (float): Size multiplier
+        """
+        texture = self.texture(surface)
+        texture.alpha = alpha
+        texture.color = tint or (255, 255, 255)
+        texture.draw(dstrect=(dest[0], dest[1],
+                              surface.get_width() * scale, surface.get_height() * scale))
+        texture.color = (255, 255, 255)
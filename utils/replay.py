@@ -0,0 +1,144 @@
+# Import required modules
+import struct
+import pygame
+from utils.constants import *
+
+# File layout: header, then one fixed-size record per input event
+REPLAY_MAGIC = b'JNRP'
+REPLAY_VERSION = 1
+HEADER = struct.Struct('<4sHHqIIB')  # magic, version, tick rate, seed, length in ticks, event count, flags
+RECORD = struct.Struct('<IBBhh')   # tick, event kind, button, x, y
+FLAG_GAME_OVER = 1  # The game ended on a bomb rather than being quit
+
+# Event kinds stored in a record
+EVENT_KINDS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+class Replay:
+    """
+    Compact recording of one game: its RNG seed and every input event,
+    stamped with the simulation tick it arrived before. Feeding the same
+    events at the same ticks into a game reset with the same seed
+    reproduces it exactly.
+    """
+
+    def __init__(self, seed, tick_rate=TICK_RATE):
+        """
+        Initialize an empty recording
+
+        Args:
+            seed (int): Seed the recorded game was reset with
+            tick_rate (int): Simulation ticks per second of the recording
+        """
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.ticks = 0  # Length of the recorded game in simulation ticks
+        self.game_over = False  # Whether a bomb ended the game (during its last tick)
+        self.data = bytearray()  # Packed RECORD entries, in arrival order
+
+    def __len__(self):
+        return len(self.data) // RECORD.size
+
+    def record(self, tick, event):
+        """
+        Append an input event
+
+        Args:
+            tick (int): Number of simulation ticks run before the event
+            event: Pygame mouse event; other event types are ignored
+        """
+        if event.type not in EVENT_KINDS:
+            return
+        kind = EVENT_KINDS.index(event.type)
+        button = getattr(event, 'button', 0)
+        x, y = event.pos
+        # Clamp to the record's coordinate range
+        x = max(-32768, min(32767, int(x)))
+        y = max(-32768, min(32767, int(y)))
+        self.data += RECORD.pack(tick, kind, button, x, y)
+        self.ticks = max(self.ticks, tick)
+
+    def truncate(self, tick):
+        """
+        Drop events recorded at or after a tick (e.g. after rewinding the game)
+
+        Args:
+            tick (int): First tick to drop events from
+        """
+        end = len(self.data)
+        while end and RECORD.unpack_from(self.data, end - RECORD.size)[0] >= tick:
+            end -= RECORD.size
+        del self.data[end:]
+        self.ticks = min(self.ticks, tick)
+        self.game_over = False
+
+    def events(self):
+        """
+        Decode the recorded events
+
+        Returns:
+            dict: {tick: [pygame events]} in arrival order
+        """
+        by_tick = {}
+        for tick, kind, button, x, y in RECORD.iter_unpack(self.data):
+            event_type = EVENT_KINDS[kind]
+            if event_type == pygame.MOUSEMOTION:
+                event = pygame.event.Event(event_type, pos=(x, y), rel=(0, 0), buttons=(1, 0, 0))
+            else:
+                event = pygame.event.Event(event_type, pos=(x, y), button=button)
+            by_tick.setdefault(tick, []).append(event)
+        return by_tick
+
+    def script(self):
+        """
+        Build a script for JellyNinja.simulate() that feeds the events back
+
+        Returns:
+            function: Maps a tick number to the list of events for that tick
+        """
+        by_tick = self.events()
+        return lambda tick: by_tick.get(tick, ())
+
+    def save(self, path):
+        """
+        Write the recording to a binary replay file
+
+        Args:
+            path (str): File to write
+        """
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.tick_rate, self.seed,
+                                self.ticks, len(self), FLAG_GAME_OVER if self.game_over else 0))
+            f.write(self.data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a binary replay file
+
+        Args:
+            path (str): File to read
+
+        Returns:
+            Replay: The loaded recording
+
+        Raises:
+            ValueError: If the file is not a replay this version can play
+        """
+        with open(path, 'rb') as f:
+            blob = f.read()
+        if len(blob) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a replay")
+        magic, version, tick_rate, seed, ticks, count, flags = HEADER.unpack_from(blob)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay")
+        if tick_rate != TICK_RATE:
+            raise ValueError(f"{path} was recorded at {tick_rate} ticks/s, not {TICK_RATE}")
+        data = blob[HEADER.size:]
+        if len(data) != count * RECORD.size:
+            raise ValueError(f"{path} is truncated")
+        replay = cls(seed, tick_rate)
+        replay.ticks = ticks
+        replay.game_over = bool(flags & FLAG_GAME_OVER)
+        replay.data = bytearray(data)
+        return replay
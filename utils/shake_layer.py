@@ -0,0 +1,58 @@
+# Import required modules
+import pygame
+from utils.constants import *
+from utils.render_backend import mark_changed
+
+
+class ShakeLayer:
+    """
+    Reusable offscreen layer for everything that shakes with the screen.
+    While the screen shakes, jellies, bombs and particles are drawn here at
+    their real positions and the layer is blitted to the screen once at the
+    shake offset, so shaking costs the same however many objects are alive.
+    """
+
+    def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT)):
+        """
+        Initialize the shake layer
+
+        Args:
+            size (tuple): (width, height) of the layer
+        """
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.bounds = self.surface.get_rect()
+        self.rect = None  # Area drawn in the last frame, cleared before the next one
+
+    def begin(self):
+        """
+        Clear what the previous frame drew and get the layer to draw on
+
+        Returns:
+            pygame.Surface: The layer surface
+        """
+        if self.rect is not None:
+            self.surface.fill((0, 0, 0, 0), self.rect)
+            self.rect = None
+        return self.surface
+
+    def end(self, screen, offset, rects):
+        """
+        Blit what was drawn this frame onto the screen, shifted by the shake offset
+
+        Args:
+            screen: Surface to draw on
+            offset (tuple): (x, y) shake offset
+            rects (list): Layer areas drawn this frame (None entries are ignored)
+
+        Returns:
+            pygame.Rect: Screen area the layer was blitted to, or None
+        """
+        rects = [rect for rect in rects if rect]
+        if not rects:
+            return None
+        rect = rects[0].unionall(rects[1:]).clip(self.bounds)
+        if not rect:
+            return None
+        self.rect = rect
+        mark_changed(self.surface, rect)
+        return screen.blit(self.surface, (rect.x + offset[0], rect.y + offset[1]), rect)
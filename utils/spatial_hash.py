@@ -0,0 +1,127 @@
+# Import required modules
+import math
+import numpy as np
+from utils.constants import *
+
+# Cell coordinates are shifted by this much before packing into one key,
+# so entities slightly outside the window still get positive keys
+CELL_OFFSET = 1 << 15
+
+
+class SpatialHash:
+    """
+    Uniform-grid broad phase over an EntityStore.
+    The grid is rebuilt with a few vectorized NumPy passes once per tick;
+    a segment query then returns only the entities in cells the segment
+    passes near, so the exact hit test runs on a handful of candidates.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        """
+        Initialize an empty grid
+
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.store = None
+        self.indexed_count = 0  # Store size when the grid was built
+        self.max_radius = 0.0
+        self.cell_keys = np.zeros(0, dtype=np.int64)    # Sorted unique occupied cells
+        self.cell_starts = np.zeros(0, dtype=np.int64)  # Start of each cell in self.entries
+        self.cell_ends = np.zeros(0, dtype=np.int64)    # End of each cell in self.entries
+        self.entries = np.zeros(0, dtype=np.int64)      # Entity indices grouped by cell
+
+    def _keys(self, cell_x, cell_y):
+        """Pack integer cell coordinates into one sortable key"""
+        return (cell_x + CELL_OFFSET) * (CELL_OFFSET * 2) + (cell_y + CELL_OFFSET)
+
+    def build(self, store):
+        """
+        Rebuild the grid from the live entities of a store
+
+        Args:
+            store (EntityStore): Entities to index
+        """
+        self.store = store
+        self.indexed_count = store.count
+        live = store.live_indices()
+        if len(live) == 0:
+            self.max_radius = 0.0
+            self.cell_keys = self.cell_starts = self.cell_ends = self.entries = np.zeros(0, dtype=np.int64)
+            return
+        cell_x = np.floor(store.x[live] / self.cell_size).astype(np.int64)
+        cell_y = np.floor(store.y[live] / self.cell_size).astype(np.int64)
+        keys = self._keys(cell_x, cell_y)
+
+        # Group entities by cell: sort by key, then find where each cell starts
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        self.cell_keys, self.cell_starts = np.unique(sorted_keys, return_index=True)
+        self.cell_ends = np.append(self.cell_starts[1:], len(sorted_keys))
+        self.entries = live[order]
+        self.max_radius = float(store.radius[live].max())
+
+    def query_segment(self, p1, p2, hit_scale=1.0):
+        """
+        Find entities that might touch a line segment
+
+        Args:
+            p1, p2 (tuple): Segment end points
+            hit_scale (float): Multiplier on radius squared used by the exact
+                test, so candidates cover an enlarged hit box
+
+        Returns:
+            numpy.ndarray: Sorted indices of live candidate entities
+        """
+        return self.query_polyline((p1, p2), hit_scale)
+
+    def query_polyline(self, points, hit_scale=1.0):
+        """
+        Find entities that might touch any segment of a polyline
+
+        Args:
+            points (sequence): (x, y) points of the polyline
+            hit_scale (float): Multiplier on radius squared used by the exact
+                test, so candidates cover an enlarged hit box
+
+        Returns:
+            numpy.ndarray: Sorted indices of live candidate entities
+        """
+        store = self.store
+        if store is None:
+            return np.zeros(0, dtype=np.int64)
+
+        # Entities spawned since the last build are not in the grid yet
+        new = np.arange(self.indexed_count, store.count)
+        if len(self.cell_keys) and len(points) >= 2:
+            cell_size = self.cell_size
+            step = cell_size / 2
+            sample_x = []
+            sample_y = []
+            for p1, p2 in zip(points[:-1], points[1:]):
+                length = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+                t = np.linspace(0.0, 1.0, max(1, int(math.ceil(length / step))) + 1)
+                sample_x.append(p1[0] + (p2[0] - p1[0]) * t)
+                sample_y.append(p1[1] + (p2[1] - p1[1]) * t)
+            sample_x = np.concatenate(sample_x)
+            sample_y = np.concatenate(sample_y)
+
+            # Every point of the polyline is within step / 2 of a sample
+            reach = self.max_radius * math.sqrt(hit_scale) + step / 2
+            ring = int(math.ceil(reach / cell_size))
+            offsets = np.arange(-ring, ring + 1)
+            cell_x = np.floor(sample_x / cell_size).astype(np.int64)
+            cell_y = np.floor(sample_y / cell_size).astype(np.int64)
+            query_x = (cell_x[:, None, None] + offsets[None, :, None]).repeat(len(offsets), axis=2)
+            query_y = (cell_y[:, None, None] + offsets[None, None, :]).repeat(len(offsets), axis=1)
+            query = np.unique(self._keys(query_x.ravel(), query_y.ravel()))
+
+            # Look the query cells up among the occupied ones
+            pos = np.minimum(np.searchsorted(self.cell_keys, query), len(self.cell_keys) - 1)
+            pos = pos[self.cell_keys[pos] == query]
+            found = [self.entries[self.cell_starts[i]:self.cell_ends[i]] for i in pos.tolist()]
+            if found:
+                new = np.concatenate(found + [new])
+        candidates = np.sort(new)
+        return candidates[store.alive[candidates]]
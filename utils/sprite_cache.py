@@ -0,0 +1,211 @@
+# Import required modules
+import math
+import threading
+import pygame
+from collections import OrderedDict
+from utils.constants import *
+
+# Quantization steps for sprite keys
+SQUISH_STEP = 0.05   # Jelly squish is rounded to this step
+ALPHA_LEVELS = 16    # Number of distinct alpha levels for faded sprites
+SPRITE_PADDING = 6   # Extra pixels around a jelly for its highlight
+MAX_SQUISH_STEP = int(round(2 / SQUISH_STEP)) - 1  # Keeps both ellipse radii positive
+
+
+class SpriteCache:
+    """
+    Lazily built, LRU-evicted cache of pre-rendered sprites.
+    Jellies, bombs, splatters and particle dots are drawn once per
+    quantized (color, size, squish, alpha) key and then reused, so drawing
+    an entity becomes a single blit that can be batched with Surface.blits.
+    """
+
+    def __init__(self, max_entries=SPRITE_CACHE_SIZE):
+        """
+        Initialize an empty sprite cache
+
+        Args:
+            max_entries (int): Number of sprites kept before the least
+                recently used one is evicted
+        """
+        self.max_entries = max_entries
+        self.sprites = OrderedDict()  # key -> (surface, (anchor_x, anchor_y))
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()  # Sprites are also requested by the simulation thread
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def clear(self):
+        """Drop every cached sprite (e.g. after the display format changes)"""
+        self.sprites.clear()
+
+    def _get(self, key, build):
+        """
+        Look up a sprite, building and caching it on a miss
+
+        Args:
+            key (tuple): Cache key
+            build: Function returning (surface, anchor) for the key
+
+        Returns:
+            tuple: (surface, (anchor_x, anchor_y)); blit at position - anchor
+        """
+        with self.lock:
+            sprite = self.sprites.get(key)
+            if sprite is not None:
+                self.sprites.move_to_end(key)
+                self.hits += 1
+                return sprite
+            self.misses += 1
+            surf, anchor = build()
+            # Match the display format when there is one, for faster blits
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            sprite = (surf, anchor)
+            self.sprites[key] = sprite
+            if len(self.sprites) > self.max_entries:
+                self.sprites.popitem(last=False)
+            return sprite
+
+    def jelly(self, color, radius, squish):
+        """
+        Get the sprite for a squished jelly with its highlight
+
+        Args:
+            color (tuple): RGB jelly color
+            radius (float): Jelly radius, rounded to whole pixels
+            squish (float): Squish factor, rounded to SQUISH_STEP
+
+        Returns:
+            tuple: (surface, anchor) centered on the jelly position
+        """
+        radius = int(round(radius))
+        step = max(1, min(int(round(squish / SQUISH_STEP)), MAX_SQUISH_STEP))
+        return self._get(('jelly', color, radius, step),
+                         lambda: self._build_jelly(color, radius, step * SQUISH_STEP))
+
+    def _build_jelly(self, color, radius, squish):
+        squished_radius_x = radius * (2 - squish)
+        squished_radius_y = radius * squish
+        width = int(math.ceil(squished_radius_x * 2)) + SPRITE_PADDING * 2
+        height = int(math.ceil(squished_radius_y * 2)) + SPRITE_PADDING * 2
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Draw squished circle
+        pygame.draw.ellipse(surf, color,
+            (SPRITE_PADDING, SPRITE_PADDING,
+             squished_radius_x * 2, squished_radius_y * 2))
+
+        # Add highlight
+        highlight_pos = (
+            SPRITE_PADDING + squished_radius_x * 0.7,
+            SPRITE_PADDING + squished_radius_y * 0.7
+        )
+        pygame.draw.circle(surf, (255, 255, 255), highlight_pos, 5)
+        return surf, (squished_radius_x + SPRITE_PADDING,
+                      squished_radius_y + SPRITE_PADDING)
+
+    def bomb(self, radius, flash_time):
+        """
+        Get the sprite for a bomb at a point in its fuse animation
+
+        Args:
+            radius (float): Bomb radius, rounded to whole pixels
+            flash_time (int): Ticks since the bomb spawned
+
+        Returns:
+            tuple: (surface, anchor) centered on the bomb position
+        """
+        radius = int(round(radius))
+        fuse_x = int(round(math.sin(flash_time * 0.2) * 10))
+        flashing = flash_time % 10 < 5
+        return self._get(('bomb', radius, fuse_x, flashing),
+                         lambda: self._build_bomb(radius, fuse_x, flashing))
+
+    def _build_bomb(self, radius, fuse_x, flashing):
+        half_width = max(radius, 15) + 1
+        top = radius + 21  # Fuse length plus the flash circle
+        surf = pygame.Surface((half_width * 2, top + radius + 1), pygame.SRCALPHA)
+        center = (half_width, top)
+
+        # Draw bomb body
+        pygame.draw.circle(surf, (30, 30, 30), center, radius)
+
+        # Draw fuse
+        fuse_start = (center[0], center[1] - radius)
+        fuse_end = (center[0] + fuse_x, center[1] - radius - 15)
+        pygame.draw.line(surf, (100, 100, 100), fuse_start, fuse_end, 3)
+
+        # Draw flashing effect
+        if flashing:
+            pygame.draw.circle(surf, (255, 200, 0), fuse_end, 5)
+        return surf, center
+
+    def splatter(self, color, size, alpha):
+        """
+        Get the sprite for a background splatter
+
+        Args:
+            color (tuple): RGB splatter color
+            size (int): Splatter diameter in pixels
+            alpha (int): Opacity (0-255), rounded to one of ALPHA_LEVELS
+
+        Returns:
+            tuple: (surface, anchor) centered on the splatter position
+        """
+        level = alpha_level(alpha)
+        return self._get(('splatter', color, size, level),
+                         lambda: self._build_splatter(color, size, level))
+
+    def _build_splatter(self, color, size, level):
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color[:3], level_alpha(level)),
+                           (size // 2, size // 2), size // 2)
+        return surf, (size // 2, size // 2)
+
+    def dot(self, color, level):
+        """
+        Get the 4x4 sprite for a particle
+
+        Args:
+            color (tuple): RGB particle color
+            level (int): Alpha level, from 0 to ALPHA_LEVELS - 1
+
+        Returns:
+            tuple: (surface, anchor) centered on the particle position
+        """
+        return self._get(('dot', color, level),
+                         lambda: self._build_dot(color, level))
+
+    def _build_dot(self, color, level):
+        surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color[:3], level_alpha(level)), (2, 2), 2)
+        return surf, (2, 2)
+
+
+def alpha_level(alpha):
+    """
+    Quantize an alpha value to one of ALPHA_LEVELS levels
+
+    Args:
+        alpha (int): Opacity from 0 to 255
+
+    Returns:
+        int: Alpha level from 0 to ALPHA_LEVELS - 1
+    """
+    return max(0, min(ALPHA_LEVELS - 1, alpha * (ALPHA_LEVELS - 1) // 255))
+
+
+def level_alpha(level):
+    """
+    Convert an alpha level back to an opacity
+
+    Args:
+        level (int): Alpha level from 0 to ALPHA_LEVELS - 1
+
+    Returns:
+        int: Opacity from 0 to 255
+    """
+    return level * 255 // (ALPHA_LEVELS - 1)
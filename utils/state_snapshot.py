@@ -0,0 +1,301 @@
+# Import required modules
+import struct
+from collections import deque
+import numpy as np
+from utils.constants import *
+
+# Snapshot layout: header, then each component's fixed-format scalars and
+# raw arrays in the order it wrote them. Arrays are prefixed with their length.
+SNAPSHOT_MAGIC = b'JNSS'
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct('<4sH')     # magic, version
+LENGTH = struct.Struct('<I')       # array length in rows
+
+# Rewind dump layout: header, then (tick, size) and the snapshot bytes for each entry
+DUMP_MAGIC = b'JNRW'
+DUMP_HEADER = struct.Struct('<4sHI')  # magic, version, snapshot count
+DUMP_ENTRY = struct.Struct('<II')     # tick, snapshot size in bytes
+
+
+class SnapshotWriter:
+    """Builds a binary snapshot from fixed-format scalars and raw NumPy arrays"""
+
+    def __init__(self):
+        """Start a snapshot with its header"""
+        self.parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION)]
+
+    def pack(self, fmt, *values):
+        """
+        Append scalars
+
+        Args:
+            fmt (str): struct format for the values (little-endian is implied)
+            *values: Values to pack
+        """
+        self.parts.append(struct.pack('<' + fmt, *values))
+
+    def array(self, array):
+        """
+        Append an array's rows (the reader must know its dtype and row width)
+
+        Args:
+            array (numpy.ndarray): Array to append
+        """
+        self.parts.append(LENGTH.pack(len(array)))
+        self.parts.append(np.ascontiguousarray(array).tobytes())
+
+    def table(self, names, columns):
+        """
+        Append equal-length arrays as the columns of one structured array,
+        which reads back with a single SnapshotReader.table() call
+
+        Args:
+            names (tuple): Column names
+            columns (list): 1D arrays, one per name
+        """
+        table = np.empty(len(columns[0]), dtype=[(name, column.dtype) for name, column in zip(names, columns)])
+        for name, column in zip(names, columns):
+            table[name] = column
+        self.array(table)
+
+    def getvalue(self):
+        """
+        Get the finished snapshot
+
+        Returns:
+            bytes: The snapshot
+        """
+        return b''.join(self.parts)
+
+
+class SnapshotReader:
+    """Reads back what a SnapshotWriter wrote, in the same order"""
+
+    def __init__(self, data):
+        """
+        Start reading a snapshot
+
+        Args:
+            data (bytes): Snapshot from SnapshotWriter.getvalue()
+
+        Raises:
+            ValueError: If the data is not a snapshot this version can read
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("data is too short to be a snapshot")
+        magic, version = HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"data is not a version {SNAPSHOT_VERSION} snapshot")
+        self.data = memoryview(data)
+        self.offset = HEADER.size
+
+    def unpack(self, fmt):
+        """
+        Read scalars
+
+        Args:
+            fmt (str): struct format the values were packed with
+
+        Returns:
+            tuple: The values
+        """
+        fmt = struct.Struct('<' + fmt)
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def array(self, dtype, width=None):
+        """
+        Read an array
+
+        Args:
+            dtype: NumPy dtype the array was written with
+            width (int): Row width of a 2D array, or None for 1D
+
+        Returns:
+            numpy.ndarray: Read-only view into the snapshot; copy what is kept
+        """
+        (rows,) = LENGTH.unpack_from(self.data, self.offset)
+        self.offset += LENGTH.size
+        count = rows * (width or 1)
+        array = np.frombuffer(self.data, dtype=dtype, count=count, offset=self.offset)
+        self.offset += array.nbytes
+        return array if width is None else array.reshape(rows, width)
+
+    def table(self, names, dtypes):
+        """
+        Read arrays written with SnapshotWriter.table()
+
+        Args:
+            names (tuple): Column names
+            dtypes (list): Column dtypes, in the same order
+
+        Returns:
+            numpy.ndarray: Read-only structured view; index it by column name
+        """
+        return self.array(list(zip(names, dtypes)))
+
+
+def save_random(writer, rng):
+    """
+    Append the state of a random.Random
+
+    Args:
+        writer (SnapshotWriter): Snapshot being written
+        rng (random.Random): Generator to save
+    """
+    version, internal, gauss = rng.getstate()
+    writer.pack('B?d', version, gauss is not None, gauss or 0.0)
+    writer.array(np.array(internal, dtype=np.uint32))
+
+
+def restore_random(reader, rng):
+    """
+    Restore the state of a random.Random
+
+    Args:
+        reader (SnapshotReader): Snapshot being read
+        rng (random.Random): Generator to restore
+    """
+    version, has_gauss, gauss = reader.unpack('B?d')
+    internal = tuple(reader.array(np.uint32).tolist())
+    rng.setstate((version, internal, gauss if has_gauss else None))
+
+
+def save_generator(writer, rng):
+    """
+    Append the state of a NumPy PCG64 Generator
+
+    Args:
+        writer (SnapshotWriter): Snapshot being written
+        rng (numpy.random.Generator): Generator to save
+    """
+    state = rng.bit_generator.state
+    if state['bit_generator'] != 'PCG64':
+        raise ValueError(f"cannot snapshot a {state['bit_generator']} generator")
+    mask = (1 << 64) - 1
+    value, inc = state['state']['state'], state['state']['inc']
+    writer.pack('QQQQ?I', value >> 64, value & mask, inc >> 64, inc & mask,
+                state['has_uint32'], state['uinteger'])
+
+
+def restore_generator(reader, rng):
+    """
+    Restore the state of a NumPy PCG64 Generator
+
+    Args:
+        reader (SnapshotReader): Snapshot being read
+        rng (numpy.random.Generator): Generator to restore
+    """
+    value_high, value_low, inc_high, inc_low, has_uint32, uinteger = reader.unpack('QQQQ?I')
+    rng.bit_generator.state = {
+        'bit_generator': 'PCG64',
+        'state': {'state': value_high << 64 | value_low, 'inc': inc_high << 64 | inc_low},
+        'has_uint32': int(has_uint32),
+        'uinteger': uinteger,
+    }
+
+
+class RewindBuffer:
+    """
+    Ring buffer of the most recent snapshots of a game, oldest dropped first.
+    Used to rewind the game and to dump its recent history after a crash.
+    """
+
+    def __init__(self, capacity=REWIND_SNAPSHOTS):
+        """
+        Initialize an empty buffer
+
+        Args:
+            capacity (int): Number of snapshots kept
+        """
+        self.snapshots = deque(maxlen=capacity)  # (tick, snapshot bytes), oldest first
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def clear(self):
+        """Drop every snapshot"""
+        self.snapshots.clear()
+
+    def push(self, tick, data):
+        """
+        Add a snapshot
+
+        Args:
+            tick (int): Simulation tick the snapshot was taken at
+            data (bytes): The snapshot
+        """
+        self.snapshots.append((tick, data))
+
+    def latest(self):
+        """
+        Get the newest snapshot
+
+        Returns:
+            tuple: (tick, snapshot bytes), or None if the buffer is empty
+        """
+        return self.snapshots[-1] if self.snapshots else None
+
+    def rewind(self, tick):
+        """
+        Find the newest snapshot taken at or before a tick, dropping newer ones
+
+        Args:
+            tick (int): Tick to rewind to
+
+        Returns:
+            tuple: (tick, snapshot bytes), or the oldest snapshot if every
+                snapshot is newer, or None if the buffer is empty
+        """
+        snapshots = self.snapshots
+        while len(snapshots) > 1 and snapshots[-1][0] > tick:
+            snapshots.pop()
+        return self.latest()
+
+    def dump(self, path):
+        """
+        Write every snapshot to a file
+
+        Args:
+            path (str): File to write
+        """
+        with open(path, 'wb') as f:
+            f.write(DUMP_HEADER.pack(DUMP_MAGIC, SNAPSHOT_VERSION, len(self.snapshots)))
+            for tick, data in self.snapshots:
+                f.write(DUMP_ENTRY.pack(tick, len(data)))
+                f.write(data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a file written by dump()
+
+        Args:
+            path (str): File to read
+
+        Returns:
+            RewindBuffer: Buffer holding the dumped snapshots
+
+        Raises:
+            ValueError: If the file is not a dump this version can read
+        """
+        with open(path, 'rb') as f:
+            blob = f.read()
+        if len(blob) < DUMP_HEADER.size:
+            raise ValueError(f"{path} is too short to be a snapshot dump")
+        magic, version, count = DUMP_HEADER.unpack_from(blob)
+        if magic != DUMP_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} snapshot dump")
+        buffer = cls(max(count, 1))
+        offset = DUMP_HEADER.size
+        for _ in range(count):
+            if offset + DUMP_ENTRY.size > len(blob):
+                raise ValueError(f"{path} is truncated")
+            tick, size = DUMP_ENTRY.unpack_from(blob, offset)
+            offset += DUMP_ENTRY.size
+            if offset + size > len(blob):
+                raise ValueError(f"{path} is truncated")
+            buffer.push(tick, blob[offset:offset + size])
+            offset += size
+        return buffer
@@ -0,0 +1,116 @@
+# Import required modules
+import numpy as np
+from utils.constants import *
+
+
+class SwipePath:
+    """
+    Motion samples of the swipe in progress, coalesced between slice checks.
+    Motion events only append points (closer samples than min_step are
+    dropped), and the game checks the whole path once per tick, so input
+    cost follows the distance swiped rather than the mouse polling rate.
+    Gaps longer than max_step, where the OS dropped samples during a fast
+    swipe, are filled in along a Catmull-Rom curve through the neighbouring
+    samples.
+    """
+
+    def __init__(self, min_step=SWIPE_MIN_STEP, max_step=SWIPE_MAX_STEP):
+        """
+        Initialize an empty path
+
+        Args:
+            min_step (float): Samples closer than this to the last kept one are dropped
+            max_step (float): Longest segment left as a straight line
+        """
+        self.min_step = min_step
+        self.max_step = max_step
+        self.points = []       # Unchecked samples, after the last checked one
+        self.previous = None   # Sample before the last checked one, for curve continuity
+
+    def start(self, pos):
+        """
+        Begin a new swipe
+
+        Args:
+            pos (tuple): (x, y) where the swipe starts
+        """
+        self.points = [pos]
+        self.previous = None
+
+    def clear(self):
+        """End the swipe"""
+        self.points = []
+        self.previous = None
+
+    def add(self, pos):
+        """
+        Add a motion sample
+
+        Args:
+            pos (tuple): (x, y) mouse position
+        """
+        points = self.points
+        if points:
+            last = points[-1]
+            if abs(pos[0] - last[0]) + abs(pos[1] - last[1]) < self.min_step:
+                return
+        points.append(pos)
+
+    def pending(self):
+        """
+        Check whether there are unchecked segments
+
+        Returns:
+            bool: True if the path has moved since the last take()
+        """
+        return len(self.points) >= 2
+
+    def take(self):
+        """
+        Get the unchecked part of the path, keeping its end to continue from
+
+        Returns:
+            numpy.ndarray: (n, 2) points of the path, with long gaps filled in
+        """
+        points = self.points
+        path = interpolate_gaps(points, self.previous, self.max_step)
+        self.previous = points[-2]
+        self.points = points[-1:]
+        return path
+
+
+def interpolate_gaps(points, before=None, max_step=SWIPE_MAX_STEP):
+    """
+    Subdivide segments longer than max_step along a uniform Catmull-Rom spline
+
+    Args:
+        points (sequence): (x, y) samples, at least two
+        before (tuple): Sample preceding the first one, or None at the start of a swipe
+        max_step (float): Longest segment left as a straight line
+
+    Returns:
+        numpy.ndarray: (n, 2) points passing through every sample in order
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    p1 = pts[:-1]
+    p2 = pts[1:]
+    lengths = np.hypot(p2[:, 0] - p1[:, 0], p2[:, 1] - p1[:, 1])
+    steps = np.maximum(1, np.ceil(lengths / max_step)).astype(np.int64)
+    if steps.max() == 1:
+        return pts
+
+    # Neighbouring samples; the ends are extended with a straight continuation
+    first = pts[0] if before is None else np.asarray(before, dtype=np.float64)
+    last = 2 * pts[-1] - pts[-2]
+    p0 = np.vstack((first[None], pts[:-2]))
+    p3 = np.vstack((pts[2:], last[None]))
+
+    # Parameter t in [0, 1) for every output point of every segment
+    segment = np.repeat(np.arange(len(steps)), steps)
+    starts = np.cumsum(steps) - steps
+    t = ((np.arange(len(segment)) - starts[segment]) / steps[segment])[:, None]
+    a, b, c, d = p0[segment], p1[segment], p2[segment], p3[segment]
+    curve = 0.5 * (2 * b + (c - a) * t
+                   + (2 * a - 5 * b + 4 * c - d) * t ** 2
+                   + (3 * b - a - 3 * c + d) * t ** 3)
+    return np.vstack((curve, pts[-1:]))
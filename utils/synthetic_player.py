@@ -0,0 +1,86 @@
+# Import required modules
+import math
+import random
+import numpy as np
+import pygame
+from utils.constants import *
+from utils.collision import polyline_circle_hits
+
+SWIPE_LENGTH = 180  # Length of a synthetic swipe in pixels
+SWIPE_POINTS = 4    # Points along a synthetic swipe
+
+
+class SyntheticPlayer:
+    """
+    Scripted stand-in for a human, for balance sweeps.
+    Every few ticks it picks a visible jelly and swipes through it, unless
+    the swipe would also cross a bomb. Reaction time, accuracy and the
+    chance of ignoring a bomb are tunable, and all its choices come from
+    its own seeded RNG so a sweep stays reproducible.
+    """
+
+    def __init__(self, seed=None, reaction=(8, 20), accuracy=0.85, blunder=0.02):
+        """
+        Initialize the player
+
+        Args:
+            seed (int): Seed for the player's decisions
+            reaction (tuple): (min, max) ticks between swipes
+            accuracy (float): Chance that a swipe goes through its target
+            blunder (float): Chance of swiping even when a bomb is in the way
+        """
+        self.rng = random.Random(seed)
+        self.reaction = reaction
+        self.accuracy = accuracy
+        self.blunder = blunder
+        self.cooldown = 0
+
+    def events(self, game):
+        """
+        Decide the input for the next tick
+
+        Args:
+            game: The Game state being played
+
+        Returns:
+            list: Pygame mouse events to feed in before the tick
+        """
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return []
+        jellies = game.jellies
+        live = jellies.live_indices()
+        live = live[(jellies.y[live] > 50) & (jellies.y[live] < WINDOW_HEIGHT - 50)]
+        if len(live) == 0:
+            return []
+        self.cooldown = self.rng.randint(*self.reaction)
+
+        # Swipe through the target at a random angle, or beside it on a miss
+        target = live[self.rng.randrange(len(live))]
+        x = float(jellies.x[target])
+        y = float(jellies.y[target])
+        angle = self.rng.uniform(0, math.pi)
+        if self.rng.random() > self.accuracy:
+            miss = float(jellies.radius[target]) * 3
+            x += math.sin(angle) * miss
+            y -= math.cos(angle) * miss
+        dx = math.cos(angle) * SWIPE_LENGTH / 2
+        dy = math.sin(angle) * SWIPE_LENGTH / 2
+        t = np.linspace(-1, 1, SWIPE_POINTS)
+        points = list(zip((x + dx * t).round().astype(int).tolist(),
+                          (y + dy * t).round().astype(int).tolist()))
+
+        # Hold back if a bomb is in the way (with some margin)
+        bombs = game.bombs
+        near = bombs.live_indices()
+        if len(near) and self.rng.random() >= self.blunder:
+            hits, _ = polyline_circle_hits(points, bombs.x[near], bombs.y[near],
+                                           bombs.radius[near], SLICE_HIT_SCALE * 2)
+            if len(hits):
+                return []
+
+        events = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=points[0], button=1)]
+        events += [pygame.event.Event(pygame.MOUSEMOTION, pos=p, rel=(0, 0), buttons=(1, 0, 0))
+                   for p in points[1:]]
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=points[-1], button=1))
+        return events
@@ -0,0 +1,56 @@
+# Import required modules
+import pygame
+from utils.constants import *
+from utils.render_backend import mark_changed
+
+
+class TrailLayer:
+    """
+    Reusable transparent layer for drawing slice trails.
+    Instead of allocating a full-window SRCALPHA surface per trail, every
+    trail is drawn onto this one layer and only its bounding box is
+    cleared and blitted to the screen.
+    """
+
+    def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT), width=4):
+        """
+        Initialize the trail layer
+
+        Args:
+            size (tuple): (width, height) of the area trails can cover
+            width (int): Line width of the trails in pixels
+        """
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.bounds = self.surface.get_rect()
+        self.width = width
+
+    def draw(self, screen, points, colors):
+        """
+        Draw one trail onto the screen through the layer
+
+        Args:
+            screen: Surface to draw on
+            points (list): (x, y) points of the trail, oldest first
+            colors (list): RGBA color of each segment (one fewer than points)
+
+        Returns:
+            pygame.Rect: Screen area the trail was blitted to, or None
+        """
+        if len(points) < 2:
+            return None
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        pad = self.width
+        rect = pygame.Rect(min(xs) - pad, min(ys) - pad,
+                           max(xs) - min(xs) + pad * 2 + 1,
+                           max(ys) - min(ys) + pad * 2 + 1).clip(self.bounds)
+        if not rect:
+            return None
+
+        # Clear and redraw only the trail's bounding box
+        self.surface.fill((0, 0, 0, 0), rect)
+        for i in range(len(points) - 1):
+            pygame.draw.line(self.surface, colors[i], points[i], points[i + 1], self.width)
+        mark_changed(self.surface, rect)
+        screen.blit(self.surface, rect.topleft, rect)
+        return rect